@@ -342,6 +342,43 @@ try:
 except Exception:
     pass
 
+# Display frames are pushed to clients from one background thread. The matrix
+# update callback only wakes the thread, which then sends the current buffer,
+# so a burst of frames (e.g. a fast animation) collapses into a single emit
+# instead of each frame serializing and sending on the writer's thread.
+_display_frame_ready = threading.Event()
+
+
+def _display_update_payload():
+    # frames go out as a binary attachment of packed RGB bytes (3 per pixel)
+    # rather than a JSON list of '#RRGGBB' strings
+    return {'width': matrix.width, 'height': matrix.height, 'rgb': matrix.get_pixels_raw()}
+
+
+def _broadcast_pixels(frame):
+    # registered with raw=True so the matrix skips hex formatting; the frame
+    # itself is re-read at send time so only the newest one goes out
+    _display_frame_ready.set()
+
+
+def _display_broadcaster():
+    while True:
+        _display_frame_ready.wait()
+        _display_frame_ready.clear()
+        if matrix is None:
+            continue
+        try:
+            socketio.emit('display_update', _display_update_payload())
+        except Exception:
+            pass
+
+
+try:
+    if socketio is not None:
+        threading.Thread(target=_display_broadcaster, daemon=True).start()
+except Exception:
+    pass
+
 # Serve cached artwork saved under the data directory. Artwork is stored in
 # <repo root>/data/artwork and served at /artwork/<filename> so it can be
 # managed separately from package static files.
@@ -640,13 +677,8 @@ def settings():
                 except Exception:
                     pass
                 if socketio is not None:
-                    def _broadcast_pixels(pix):
-                        try:
-                            socketio.emit('display_update', {'width': matrix.width, 'height': matrix.height, 'pixels': pix})
-                        except Exception:
-                            pass
                     try:
-                        matrix.set_on_update(_broadcast_pixels)
+                        matrix.set_on_update(_broadcast_pixels, raw=True)
                     except Exception:
                         pass
         except Exception:
@@ -1218,13 +1250,8 @@ try:
     # if socketio available, register a notifier so updates are pushed to clients
     try:
             if socketio is not None:
-                def _broadcast_pixels(pix):
-                    try:
-                        socketio.emit('display_update', {'width': matrix.width, 'height': matrix.height, 'pixels': pix})
-                    except Exception:
-                        pass
                 try:
-                    matrix.set_on_update(_broadcast_pixels)
+                    matrix.set_on_update(_broadcast_pixels, raw=True)
                 except Exception:
                     # fallback: set attribute for legacy behavior
                     try:
@@ -1890,7 +1917,7 @@ def api_animations_list():
         files = []
         import os
         for fn in os.listdir(animations_dir):
-            # include GIFs and WLED-style JSON exports
+            # only GIF animations are supported
             if fn.lower().endswith('.gif'):
                 files.append(fn)
         return jsonify({'animations': files})
@@ -2221,7 +2248,7 @@ if _HAVE_SOCKETIO:
             # send initial display buffer
             if matrix is not None:
                 try:
-                    socketio.emit('display_update', {'width': matrix.width, 'height': matrix.height, 'pixels': matrix.get_pixels()})
+                    socketio.emit('display_update', _display_update_payload())
                 except Exception:
                     pass
         except Exception:
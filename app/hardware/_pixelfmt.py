@@ -0,0 +1,152 @@
+"""
+Pixel format helpers shared by the LED matrix backends.
+
+The rest of the app talks in row-major lists of '#RRGGBB' strings while
+PIL images and LED drivers want packed RGB bytes (3 bytes per pixel). These
+helpers convert between the two using the C-implemented bytes.fromhex() /
+bytes.hex() so the per-pixel work does not run in the interpreter, and write
+packed colours to rpi_ws281x strips (matrix and nightlight) the same way.
+"""
+from __future__ import annotations
+
+import collections
+import functools
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import rpi_ws281x as _ws
+except Exception:
+    _ws = None
+
+
+@functools.lru_cache(maxsize=8192)
+def _coerce_color_str(s: str) -> str:
+    try:
+        s = s.strip()
+        if s.startswith('#') and (len(s) == 7 or len(s) == 4):
+            # normalize 3-char to 6-char
+            if len(s) == 4:
+                r = s[1]*2; g = s[2]*2; b = s[3]*2
+                return f'#{r}{g}{b}'.upper()
+            return s.upper()
+        # allow integer RGB tuple like '255,0,0' or (255,0,0)
+        if ',' in s:
+            parts = [int(p.strip()) for p in s.split(',')]
+            return '#%02X%02X%02X' % (parts[0], parts[1], parts[2])
+        return '#000000'
+    except Exception:
+        return '#000000'
+
+
+def coerce_color(v) -> str:
+    """Normalize a pixel value to '#RRGGBB'; unparseable values become black.
+
+    Results are memoized on the string form since frames reuse a small
+    palette of colours.
+    """
+    if v is None:
+        return '#000000'
+    try:
+        return _coerce_color_str(v if type(v) is str else str(v))
+    except Exception:
+        return '#000000'
+
+
+def parse_hex_list(colors: Sequence[str]) -> bytes:
+    """Pack a list of '#RRGGBB' strings into row-major RGB bytes.
+
+    Entries that cannot be parsed become black, matching the per-pixel
+    parsing the backends used before.
+    """
+    n = len(colors)
+    try:
+        # fast path only when every entry is exactly '#' + 6 chars, so a bad
+        # entry can never shift the pixels after it
+        if n and set(map(len, colors)) == {7}:
+            joined = ''.join(colors)
+            if joined[::7] == '#' * n:
+                raw = bytes.fromhex(joined.replace('#', ''))
+                # fromhex skips whitespace, so a length mismatch means a malformed entry
+                if len(raw) == 3 * n:
+                    return raw
+    except (ValueError, TypeError):
+        pass
+    out = bytearray(3 * n)
+    for i, c in enumerate(colors):
+        try:
+            hexc = c.lstrip('#')
+            out[3 * i] = int(hexc[0:2], 16)
+            out[3 * i + 1] = int(hexc[2:4], 16)
+            out[3 * i + 2] = int(hexc[4:6], 16)
+        except Exception:
+            out[3 * i:3 * i + 3] = b'\x00\x00\x00'
+    return bytes(out)
+
+
+def format_hex_list(raw: bytes) -> List[str]:
+    """Unpack row-major RGB bytes into a list of '#RRGGBB' strings."""
+    s = raw.hex().upper()
+    return ['#' + s[i:i + 6] for i in range(0, len(s), 6)]
+
+
+def pack_rgb_u32(raw: bytes, scratch: Optional[bytearray] = None) -> Tuple[int, ...]:
+    """Pack row-major RGB bytes into 0x00RRGGBB integers (rpi_ws281x Color layout).
+
+    scratch, when given, is a zeroed bytearray of 4 bytes per pixel reused
+    across calls instead of allocating a new one every frame.
+    """
+    n = len(raw) // 3
+    words = scratch if scratch is not None and len(scratch) == 4 * n else bytearray(4 * n)
+    words[1::4] = raw[0::3]
+    words[2::4] = raw[1::3]
+    words[3::4] = raw[2::3]
+    return struct.unpack('>%dI' % n, words)
+
+
+@functools.lru_cache(maxsize=32)
+def _volume_bar_colors(color: str) -> Tuple[str, str]:
+    c = color.strip().lstrip('#')
+    # normalize 3-char to 6-char
+    if len(c) == 3:
+        c = c[0] * 2 + c[1] * 2 + c[2] * 2
+    try:
+        fr, fg, fb = bytes.fromhex(c[0:6])
+    except ValueError:
+        fr, fg, fb = 0, 255, 0
+    # darker remainder color (x * 31/256, ~12%), integer-only
+    dr = (fr * 31) >> 8; dg = (fg * 31) >> 8; db = (fb * 31) >> 8
+    return '#%02X%02X%02X' % (fr, fg, fb), '#%02X%02X%02X' % (dr, dg, db)
+
+
+def volume_bar_colors(color) -> Tuple[str, str]:
+    """Return the (filled, remainder) '#RRGGBB' colours for a volume bar.
+
+    Invalid colours fall back to green. Memoized since callers use one or
+    two bar colours for the lifetime of the app.
+    """
+    return _volume_bar_colors(str(color or '#00FF00'))
+
+
+def led_setter(strip):
+    """Return a callable(index, color) writing one LED on strip.
+
+    rpi_ws281x's PixelStrip.setPixelColor goes through __setitem__ before it
+    reaches the C ws2811_led_set(); when the binding exposes the channel
+    handle, bind the C call directly to skip the Python wrapper per LED.
+    """
+    led_set = getattr(getattr(_ws, 'ws', None), 'ws2811_led_set', None)
+    channel = getattr(strip, '_channel', None)
+    if led_set is not None and channel is not None:
+        return functools.partial(led_set, channel)
+    return strip.setPixelColor
+
+
+def write_leds(set_pixel, indices, colors) -> None:
+    """Call set_pixel(index, color) for each pair.
+
+    map() drives the loop from C and the zero-length deque drains it, so no
+    bytecode runs per LED; with the C setter from led_setter() the whole
+    frame write stays out of the interpreter.
+    """
+    collections.deque(map(set_pixel, indices, colors), maxlen=0)
@@ -4,8 +4,9 @@ Display manager and plugin system for multiple LED matrix backends.
 This module provides a unified `create_matrix(width,height,storage=None)`
 factory which returns an object with the same surface methods used by
 the rest of the app (get_pixels, set_pixels, set_brightness, play_animation_from_gif,
-play_wled_json, stop_animation, is_animating, show_volume_bar, width, height,
-and an `_on_update` callback).
+stop_animation, is_animating, show_volume_bar, width, height, and an
+`_on_update` callback). Only GIF animations are supported; WLED JSON
+playback has been removed.
 
 Plugins are responsible for resizing a provided PIL Image to their native
 output size when `show_image()` is called. The manager accepts traditional
@@ -14,15 +15,29 @@ delegating to the active plugin.
 """
 from __future__ import annotations
 
+import itertools
 import json
+import queue
+import sys
 import threading
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Final
 from pathlib import Path
-from utils.logging_config import get_logger
+from utils.logging_config import get_logger, log_exception_throttled
+from ._pixelfmt import coerce_color, parse_hex_list, format_hex_list, volume_bar_colors
 
 log = get_logger(__name__)
 
+# Brightness range (percent) accepted by the plugins
+_BRIGHT_MIN: Final = 0
+_BRIGHT_MAX: Final = 100
+# Volume bar default display time
+_VOL_DEFAULT_MS: Final = 1500
+# Polling interval used while an animation is paused
+_POLL_SEC: Final = 0.05
+# GIF frames decoded ahead of playback on the first pass
+_PREFETCH_FRAMES: Final = 8
+
 try:
     from PIL import Image
     _HAVE_PIL = True
@@ -38,8 +53,10 @@ class BasePlugin:
         self.width = int(width)
         self.height = int(height)
         self.cfg = cfg or {}
-        # callback to notify when pixels change: cb(list_of_hex)
+        # callback to notify when pixels change: cb(list_of_hex), or
+        # cb(packed_rgb_bytes) when registered with raw=True
         self._on_update = None
+        self._on_update_raw = False
         # animation playback state
         self._anim_thread = None
         self._anim_stop = threading.Event()
@@ -47,8 +64,28 @@ class BasePlugin:
         self._anim_paused = threading.Event()
         self._anim_lock = threading.Lock()
 
-    def set_on_update(self, cb):
+    def set_on_update(self, cb, raw: bool = False):
+        """Register cb to be called with each new frame.
+
+        With raw=True cb receives packed row-major RGB bytes (3 per pixel)
+        instead of a list of '#RRGGBB' strings, so no hex formatting is done
+        for listeners that do not need it.
+        """
         self._on_update = cb
+        self._on_update_raw = bool(raw)
+
+    def _notify_update(self, raw: bytes, flat: Optional[List[str]] = None):
+        """Pass a new frame to the update listener in the format it registered for."""
+        cb = self._on_update
+        if cb is None:
+            return
+        try:
+            if self._on_update_raw:
+                cb(raw)
+            else:
+                cb(flat if flat is not None else format_hex_list(raw))
+        except Exception:
+            log.exception('%s on_update callback failed', type(self).__name__)
 
     def fast_write_flat(self, flat_pixels: Optional[List[str]]):
         """Optional fast-path for writing a flat row-major list of hex colors.
@@ -72,14 +109,9 @@ class BasePlugin:
         if pixels is None:
             return
         # pixels may be nested rows or flat
-        flat = []
         if isinstance(pixels, list) and pixels and isinstance(pixels[0], list):
-            for row in pixels:
-                for v in row:
-                    flat.append(self._coerce_color(v))
-        else:
-            for v in pixels:
-                flat.append(self._coerce_color(v))
+            pixels = itertools.chain.from_iterable(pixels)
+        flat = list(map(self._coerce_color, pixels))
         # clamp/pad
         expected = self.width * self.height
         if len(flat) < expected:
@@ -88,15 +120,7 @@ class BasePlugin:
             flat = flat[:expected]
 
         # build PIL image
-        img = Image.new('RGB', (self.width, self.height))
-        for y in range(self.height):
-            for x in range(self.width):
-                hexc = flat[y * self.width + x].lstrip('#')
-                try:
-                    r = int(hexc[0:2], 16); g = int(hexc[2:4], 16); b = int(hexc[4:6], 16)
-                except Exception:
-                    r, g, b = 0, 0, 0
-                img.putpixel((x, y), (r, g, b))
+        img = Image.frombytes('RGB', (self.width, self.height), parse_hex_list(flat))
         try:
             self.show_image(img)
         except Exception:
@@ -106,6 +130,10 @@ class BasePlugin:
         # best-effort: not all plugins expose readable buffer; return black buffer
         return ['#000000'] * (self.width * self.height)
 
+    def get_pixels_raw(self) -> bytes:
+        """Return the buffer as packed row-major RGB bytes (3 per pixel)."""
+        return parse_hex_list(self.get_pixels())
+
     def set_brightness(self, percent: int):
         return
 
@@ -132,62 +160,112 @@ class BasePlugin:
             pass
 
         def _runner():
+            # set when this run ends so its decoder thread cannot outlive it
+            # (the shared stop event is cleared again by the next animation)
+            run_done = threading.Event()
             try:
                 from PIL import Image, ImageSequence
                 im = Image.open(path)
+                # prepared frames and their durations, filled lazily during the
+                # first pass so playback starts after decoding a single frame
                 frames = []
                 durations = []
-                for frame in ImageSequence.Iterator(im):
-                    f = frame.convert('RGB').resize((self.width, self.height), Image.NEAREST)
-                    frames.append(f.copy())
-                    dur = frame.info.get('duration', 100)
-                    durations.append(dur / 1000.0)
-                if not frames:
-                    return
+
+                def _decode():
+                    prev_raw = None
+                    for frame in ImageSequence.Iterator(im):
+                        # copy first: the sequence iterator reuses the same image object
+                        f = frame.copy().convert('RGB').resize((self.width, self.height), Image.NEAREST)
+                        dur = frame.info.get('duration', 100) / 1000.0
+                        # identical consecutive frames (common for held frames) are
+                        # merged into one longer frame to avoid redundant writes
+                        raw = f.tobytes()
+                        if raw == prev_raw:
+                            durations[-1] += dur
+                            yield None, dur
+                            continue
+                        prev_raw = raw
+                        # convert once so later loops only have to push the frame
+                        frames.append(self._prepare_frame(f))
+                        durations.append(dur)
+                        yield frames[-1], dur
+
+                # the first pass decodes on a separate thread so decoding the
+                # next frames overlaps with waiting out the current one
+                prefetch = queue.Queue(maxsize=_PREFETCH_FRAMES)
+
+                def _put(item) -> bool:
+                    while True:
+                        try:
+                            prefetch.put(item, timeout=_POLL_SEC)
+                            return True
+                        except queue.Full:
+                            if run_done.is_set() or self._anim_stop.is_set():
+                                return False
+
+                def _decoder():
+                    try:
+                        for item in _decode():
+                            if not _put(item):
+                                return
+                    except Exception:
+                        log.exception('GIF frame decode failed')
+                    finally:
+                        # end marker; if stopped with a full queue the consumer
+                        # is not blocked and notices the stop on its own
+                        _put(None)
+
+                def _prefetched():
+                    while True:
+                        item = prefetch.get()
+                        if item is None:
+                            return
+                        yield item
+
                 self._anim_stop.clear()
                 self._anim_paused.clear()
+                threading.Thread(target=_decoder, daemon=True).start()
+                source = _prefetched()
+                first_pass = True
+                # frames are scheduled against a monotonic deadline so slow
+                # frame writes do not accumulate drift over a long animation
+                deadline = time.monotonic()
                 while not self._anim_stop.is_set():
-                    for idx, f in enumerate(frames):
+                    for f, dur in source:
                         # honor pause flag: block here until resumed or stopped
-                        while self._anim_paused.is_set() and not self._anim_stop.is_set():
-                            time.sleep(0.05)
+                        if self._anim_paused.is_set():
+                            while self._anim_paused.is_set() and not self._anim_stop.is_set():
+                                self._anim_stop.wait(_POLL_SEC)
+                            # restart the schedule so paused time is not caught up
+                            deadline = time.monotonic()
                         if self._anim_stop.is_set():
                             break
-                        try:
-                            # prefer plugin image API
+                        delay = max(0.01, dur / max(0.001, float(speed)))
+                        # more than two frames behind: drop this frame to catch up
+                        behind = time.monotonic() - deadline > 2 * delay
+                        if behind and first_pass:
+                            # while decoding, lateness is decode time: rebase instead of dropping
+                            deadline = time.monotonic()
+                            behind = False
+                        # f is None for a duplicate of the previous frame: just hold it
+                        if f is not None and not behind:
                             try:
-                                self.show_image(f)
+                                self._show_frame(f)
                             except Exception:
-                                # fallback: build flat pixels and use plugin fast-write when available
-                                flat = []
-                                for y in range(self.height):
-                                    for x in range(self.width):
-                                        r, g, b = f.getpixel((x, y))
-                                        flat.append('#%02X%02X%02X' % (r, g, b))
-                                try:
-                                    self.fast_write_flat(flat)
-                                except Exception:
-                                    try:
-                                        self.set_pixels(flat)
-                                    except Exception:
-                                        pass
-                        except Exception:
-                            log.exception('Error applying animation frame')
-                        # wait honoring speed and stop flag
-                        delay = max(0.01, durations[idx] / max(0.001, float(speed)))
-                        waited = 0.0
-                        while waited < delay and not self._anim_stop.is_set():
-                            # also respect pause during frame delay
-                            if self._anim_paused.is_set():
-                                time.sleep(min(0.05, delay - waited))
-                            else:
-                                time.sleep(min(0.05, delay - waited))
-                            waited += min(0.05, delay - waited)
-                    if not loop:
+                                log.exception('Error applying animation frame')
+                        # wait until this frame's deadline; stop wakes the wait immediately
+                        deadline += delay
+                        remaining = deadline - time.monotonic()
+                        if remaining > 0:
+                            self._anim_stop.wait(remaining)
+                    if not loop or not frames or self._anim_stop.is_set():
                         break
+                    source = zip(frames, durations)
+                    first_pass = False
             except Exception:
                 log.exception('GIF animation playback failed')
             finally:
+                run_done.set()
                 # mark finished
                 try:
                     with self._anim_lock:
@@ -203,6 +281,30 @@ class BasePlugin:
             self._anim_paused.clear()
             t.start()
 
+    def _prepare_frame(self, img: 'Image.Image'):
+        """Convert a decoded animation frame (RGB, native size) for _show_frame().
+
+        Called once per frame when an animation is loaded so the playback loop
+        only has to push ready-made frames. The default keeps the PIL image.
+        """
+        return img
+
+    def _show_frame(self, frame):
+        """Push a frame produced by _prepare_frame() to the display."""
+        try:
+            # prefer plugin image API
+            self.show_image(frame)
+        except Exception:
+            # fallback: build flat pixels and use plugin fast-write when available
+            flat = format_hex_list(frame.tobytes())
+            try:
+                self.fast_write_flat(flat)
+            except Exception:
+                try:
+                    self.set_pixels(flat)
+                except Exception:
+                    pass
+
     def stop_animation(self):
         try:
             with self._anim_lock:
@@ -245,26 +347,14 @@ class BasePlugin:
         except Exception:
             return False
 
-    def show_volume_bar(self, volume: int, duration_ms: int = 1500, color: str = '#00FF00', mode: str = 'overlay'):
+    def show_volume_bar(self, volume: int, duration_ms: int = _VOL_DEFAULT_MS, color: str = '#00FF00', mode: str = 'overlay'):
         return
 
-    @staticmethod
-    def _coerce_color(v) -> str:
-        try:
-            if v is None:
-                return '#000000'
-            s = str(v).strip()
-            if s.startswith('#') and (len(s) == 7 or len(s) == 4):
-                if len(s) == 4:
-                    r = s[1]*2; g = s[2]*2; b = s[3]*2
-                    return f'#{r}{g}{b}'.upper()
-                return s.upper()
-            if ',' in s:
-                parts = [int(p.strip()) for p in s.split(',')]
-                return '#%02X%02X%02X' % (parts[0], parts[1], parts[2])
-            return '#000000'
-        except Exception:
-            return '#000000'
+    def cleanup(self):
+        """Stop background work before the plugin is replaced."""
+        self.stop_animation()
+
+    _coerce_color = staticmethod(coerce_color)
 
 
 class WS2812Plugin(BasePlugin):
@@ -288,11 +378,12 @@ class WS2812Plugin(BasePlugin):
         except Exception:
             self._impl = None
 
-    def set_on_update(self, cb):
-        super().set_on_update(cb)
+    def set_on_update(self, cb, raw: bool = False):
+        super().set_on_update(cb, raw=raw)
         if self._impl is not None:
             try:
                 self._impl._on_update = cb
+                self._impl._on_update_raw = bool(raw)
             except Exception:
                 pass
 
@@ -304,23 +395,33 @@ class WS2812Plugin(BasePlugin):
         # resize into plugin native size
         try:
             im = img.convert('RGB').resize((self.width, self.height), Image.NEAREST)
-            flat = []
-            for y in range(self.height):
-                for x in range(self.width):
-                    r, g, b = im.getpixel((x, y))
-                    flat.append('#%02X%02X%02X' % (r, g, b))
+            flat = format_hex_list(im.tobytes())
             # delegate to legacy implementation
             self._impl.set_pixels(flat)
         except Exception:
             log.exception('WS2812Plugin failed to show_image')
 
+    def _prepare_frame(self, img: 'Image.Image'):
+        # the legacy matrix consumes hex lists, so convert animation frames up front.
+        # Interning makes every cached frame reference one shared string per
+        # colour, so a frame costs a list of pointers rather than N new strings.
+        return list(map(sys.intern, format_hex_list(img.tobytes())))
+
+    def _show_frame(self, frame):
+        if self._impl is None:
+            return
+        self._impl.set_pixels(frame)
+
     def fast_write_flat(self, flat_pixels: Optional[List[str]]):
         # If legacy impl has hardware handle, use fast helper; otherwise fallback
         try:
             if getattr(self, '_impl', None) is not None and getattr(self._impl, '_hw', None) is not None:
                 try:
-                    from .ledmatrix import write_hw_buffer
-                    write_hw_buffer(getattr(self._impl, '_hw'), flat_pixels, self.width, self.height, getattr(self._impl, '_serpentine', False))
+                    # go through the matrix's writer thread so the strip is
+                    # never written from two threads at once
+                    n = self.width * self.height
+                    raw = parse_hex_list(list(flat_pixels)[:n])
+                    self._impl._queue_hw(raw + bytes(3 * n - len(raw)))
                     return
                 except Exception:
                     pass
@@ -338,13 +439,18 @@ class WS2812Plugin(BasePlugin):
             return super().get_pixels()
         return self._impl.get_pixels()
 
+    def get_pixels_raw(self) -> bytes:
+        if self._impl is None:
+            return super().get_pixels_raw()
+        return self._impl.get_pixels_raw()
+
     def set_brightness(self, percent: int):
         if self._impl is None:
             return
         try:
             self._impl.set_brightness(percent)
         except Exception:
-            log.exception('set_brightness failed for WS2812Plugin')
+            log_exception_throttled(log, 'ws2812.set_brightness', 'set_brightness failed for WS2812Plugin')
 
     def get_brightness(self) -> int:
         if self._impl is None:
@@ -407,11 +513,19 @@ class WS2812Plugin(BasePlugin):
                 log.exception('legacy is_animating failed; falling back')
         return super().is_animating()
 
-    def show_volume_bar(self, volume: int, duration_ms: int = 1500, color: str = '#00FF00', mode: str = 'overlay'):
+    def show_volume_bar(self, volume: int, duration_ms: int = _VOL_DEFAULT_MS, color: str = '#00FF00', mode: str = 'overlay'):
         if self._impl is None:
             return
         return self._impl.show_volume_bar(volume, duration_ms=duration_ms, color=color, mode=mode)
 
+    def cleanup(self):
+        super().cleanup()
+        if self._impl is not None:
+            try:
+                self._impl.close()
+            except Exception:
+                log.exception('Failed to close LED matrix')
+
 
 class RGBMatrixPlugin(BasePlugin):
     """Plugin that attempts to use the rpi-rgb-led-matrix Python bindings.
@@ -428,6 +542,8 @@ class RGBMatrixPlugin(BasePlugin):
         self._saved_brightness = None
         # Cache brightness for when hardware is not present
         self._cached_brightness = 100
+        # last value pushed to hardware; used to skip redundant writes
+        self._last_brightness = -1
         # use a PIL image buffer when possible; fall back to list of hex strings
         if _HAVE_PIL:
             try:
@@ -436,7 +552,17 @@ class RGBMatrixPlugin(BasePlugin):
                 self._buffer_img = None
         else:
             self._buffer_img = None
-        self._buffer = ['#000000'] * (self.width * self.height) if self._buffer_img is None else None
+        # packed RGB fallback buffer (3 bytes per pixel), only used without an image buffer
+        self._buffer = bytearray(3 * self.width * self.height) if self._buffer_img is None else None
+        # scratch list reused by show_volume_bar to build the overlay frame
+        self._vol_scratch = None
+        # volume overlay state (see show_volume_bar)
+        self._vol_overlay_active = False
+        self._vol_overlay_mode = 'overlay'
+        self._vol_overlay_pixels = None
+        self._vol_overlay_slice = None
+        self._vol_overlay_stop = None
+        self._vol_overlay_thread = None
         # try to initialize rgbmatrix
         try:
             from rgbmatrix import RGBMatrix, RGBMatrixOptions
@@ -482,18 +608,7 @@ class RGBMatrixPlugin(BasePlugin):
             try:
                 # prefer storing the PIL image buffer
                 self._buffer_img = im
-                # also update flat buffer for older consumers
-                flat = []
-                for y in range(self.height):
-                    for x in range(self.width):
-                        r, g, b = im.getpixel((x, y))
-                        flat.append('#%02X%02X%02X' % (r, g, b))
-                self._buffer = flat
-                if self._on_update:
-                    try:
-                        self._on_update(list(self._buffer))
-                    except Exception:
-                        log.exception('RGBMatrixPlugin on_update callback failed')
+                self._notify_update(im.tobytes())
             except Exception:
                 log.exception('RGBMatrixPlugin buffering failed')
         except Exception:
@@ -513,15 +628,8 @@ class RGBMatrixPlugin(BasePlugin):
         # write into PIL image
         if _HAVE_PIL:
             try:
-                img = Image.new('RGB', (self.width, self.height))
-                for y in range(self.height):
-                    for x in range(self.width):
-                        hexc = fp[y * self.width + x].lstrip('#')
-                        try:
-                            r = int(hexc[0:2], 16); g = int(hexc[2:4], 16); b = int(hexc[4:6], 16)
-                        except Exception:
-                            r, g, b = 0, 0, 0
-                        img.putpixel((x, y), (r, g, b))
+                raw = parse_hex_list(fp)
+                img = Image.frombytes('RGB', (self.width, self.height), raw)
                 # attempt hardware push
                 if self._hardware is not None:
                     try:
@@ -533,12 +641,7 @@ class RGBMatrixPlugin(BasePlugin):
                         log.exception('RGBMatrix hardware fast write failed; falling back')
                 # update internal buffer and notify
                 self._buffer_img = img
-                self._buffer = fp
-                if self._on_update:
-                    try:
-                        self._on_update(list(self._buffer))
-                    except Exception:
-                        log.exception('RGBMatrixPlugin on_update callback failed')
+                self._notify_update(raw, fp)
                 return
             except Exception:
                 log.exception('RGBMatrixPlugin fast_write_flat failed')
@@ -547,22 +650,14 @@ class RGBMatrixPlugin(BasePlugin):
 
     def set_pixels(self, pixels: Optional[List[str]] = None, bypass_overlay: bool = False):
         # If a volume overlay is active in 'pause' mode, block writes unless bypass_overlay is True
-        try:
-            if getattr(self, '_vol_overlay_active', False) and not bypass_overlay and getattr(self, '_vol_overlay_mode', 'overlay') == 'pause':
-                return
-        except Exception:
-            pass
+        if self._vol_overlay_active and not bypass_overlay and self._vol_overlay_mode == 'pause':
+            return
         if pixels is None:
             return
         # normalize to flat list of hex colors
-        flat = []
         if isinstance(pixels, list) and pixels and isinstance(pixels[0], list):
-            for row in pixels:
-                for v in row:
-                    flat.append(self._coerce_color(v))
-        else:
-            for v in pixels:
-                flat.append(self._coerce_color(v))
+            pixels = itertools.chain.from_iterable(pixels)
+        flat = list(map(self._coerce_color, pixels))
         expected = self.width * self.height
         if len(flat) < expected:
             flat.extend(['#000000'] * (expected - len(flat)))
@@ -575,28 +670,17 @@ class RGBMatrixPlugin(BasePlugin):
                 # If an overlay is active in 'overlay' mode and this write is not explicitly bypassing,
                 # merge the overlay pixels onto the new buffer so the overlay remains visible.
                 try:
-                    if getattr(self, '_vol_overlay_active', False) and not bypass_overlay and getattr(self, '_vol_overlay_mode', 'overlay') == 'overlay':
-                        overpix = getattr(self, '_vol_overlay_pixels', None)
-                        if isinstance(overpix, list) and len(overpix) == expected:
-                            for i, v in enumerate(overpix):
-                                try:
-                                    if v and v != '#000000':
-                                        flat[i] = v
-                                except Exception:
-                                    continue
+                    if self._vol_overlay_active and not bypass_overlay and self._vol_overlay_mode == 'overlay':
+                        overpix = self._vol_overlay_pixels
+                        sl = self._vol_overlay_slice
+                        if overpix is not None and sl is not None:
+                            # the overlay is just the bar row
+                            flat[sl] = overpix
                 except Exception:
                     pass
 
-                for y in range(self.height):
-                    for x in range(self.width):
-                        hexc = flat[y * self.width + x].lstrip('#')
-                        try:
-                            r = int(hexc[0:2], 16); g = int(hexc[2:4], 16); b = int(hexc[4:6], 16)
-                        except Exception:
-                            r, g, b = 0, 0, 0
-                        self._buffer_img.putpixel((x, y), (r, g, b))
-                # update fallback flat buffer too
-                self._buffer = flat
+                raw = parse_hex_list(flat)
+                self._buffer_img.frombytes(raw)
                 # if hardware available, try to push the PIL image
                 if self._hardware is not None:
                     try:
@@ -607,49 +691,50 @@ class RGBMatrixPlugin(BasePlugin):
                     except Exception:
                         log.exception('RGBMatrix hardware image set failed during set_pixels')
                 # notify UI
-                if self._on_update:
-                    try:
-                        self._on_update(list(self._buffer))
-                    except Exception:
-                        log.exception('RGBMatrixPlugin on_update callback failed')
+                self._notify_update(raw, flat)
                 return
             except Exception:
                 log.exception('RGBMatrixPlugin failed to write to image buffer')
 
-        # fallback: keep flat buffer and notify
-        self._buffer = flat
-        if self._on_update:
-            try:
-                self._on_update(list(self._buffer))
-            except Exception:
-                log.exception('RGBMatrixPlugin on_update callback failed')
+        # fallback: keep packed buffer and notify
+        raw = parse_hex_list(flat)
+        self._buffer = bytearray(raw)
+        self._notify_update(raw, flat)
 
     def get_pixels(self):
         # prefer reading from PIL image buffer when present
         if self._buffer_img is not None:
             try:
-                flat = []
-                for y in range(self.height):
-                    for x in range(self.width):
-                        r, g, b = self._buffer_img.getpixel((x, y))
-                        flat.append('#%02X%02X%02X' % (r, g, b))
-                return flat
+                return format_hex_list(self._buffer_img.tobytes())
             except Exception:
                 log.exception('Failed to read pixels from image buffer')
         # fallback
-        return list(self._buffer) if self._buffer is not None else ['#000000'] * (self.width * self.height)
+        return format_hex_list(self._buffer) if self._buffer is not None else ['#000000'] * (self.width * self.height)
 
-    def set_brightness(self, percent: int):
-        if self._hardware is not None:
+    def get_pixels_raw(self) -> bytes:
+        if self._buffer_img is not None:
             try:
-                self._hardware.brightness = max(0, min(100, int(percent)))
-                # Also cache it so get_brightness returns the correct value
-                self._cached_brightness = max(0, min(100, int(percent)))
+                return self._buffer_img.tobytes()
             except Exception:
-                log.exception('RGBMatrixPlugin set_brightness failed')
-        else:
+                log.exception('Failed to read pixels from image buffer')
+        return bytes(self._buffer) if self._buffer is not None else super().get_pixels_raw()
+
+    def set_brightness(self, percent: int):
+        v = max(_BRIGHT_MIN, min(_BRIGHT_MAX, int(percent)))
+        # Also cache it so get_brightness returns the correct value
+        self._cached_brightness = v
+        if self._hardware is None:
             # No hardware - just cache the value
-            self._cached_brightness = max(0, min(100, int(percent)))
+            return
+        # Writing brightness makes the rgbmatrix driver recompute its GPIO
+        # timings, so skip the write when the value has not changed.
+        if v == self._last_brightness:
+            return
+        try:
+            self._hardware.brightness = v
+            self._last_brightness = v
+        except Exception:
+            log_exception_throttled(log, 'rgbmatrix.set_brightness', 'RGBMatrixPlugin set_brightness failed')
 
     def get_brightness(self) -> int:
         if self._hardware is not None:
@@ -659,7 +744,7 @@ class RGBMatrixPlugin(BasePlugin):
                 self._cached_brightness = brightness
                 return brightness
             except Exception:
-                log.exception('RGBMatrixPlugin get_brightness failed')
+                log_exception_throttled(log, 'rgbmatrix.get_brightness', 'RGBMatrixPlugin get_brightness failed')
         # Return cached value (whether hardware failed or isn't present)
         return self._cached_brightness
     
@@ -672,25 +757,27 @@ class RGBMatrixPlugin(BasePlugin):
         try:
             if on:
                 # Restore previous brightness
-                saved = getattr(self, '_saved_brightness', None)
+                saved = self._saved_brightness
                 if saved is not None:
                     self._hardware.brightness = saved
                 else:
                     self._hardware.brightness = 25  # Default
+                self._last_brightness = self._hardware.brightness
                 self._power_on = True
             else:
                 # Save current brightness and turn off
                 self._saved_brightness = self._hardware.brightness
                 self._hardware.brightness = 0
+                self._last_brightness = 0
                 self._power_on = False
         except Exception:
             log.exception('RGBMatrixPlugin set_power failed')
     
     def get_power(self) -> bool:
         """Get current power state."""
-        return getattr(self, '_power_on', True)
+        return self._power_on
 
-    def show_volume_bar(self, volume: int, duration_ms: int = 1500, color: str = '#00FF00', mode: str = 'overlay'):
+    def show_volume_bar(self, volume: int, duration_ms: int = _VOL_DEFAULT_MS, color: str = '#00FF00', mode: str = 'overlay'):
         """Display a temporary volume bar on the bottom row similar to legacy LEDMatrix.
 
         This implementation snapshots the current buffer, writes an overlay for
@@ -704,13 +791,13 @@ class RGBMatrixPlugin(BasePlugin):
 
         # cancel previous overlay if present
         try:
-            prev_ev = getattr(self, '_vol_overlay_stop', None)
+            prev_ev = self._vol_overlay_stop
             if prev_ev is not None:
                 try:
                     prev_ev.set()
                 except Exception:
                     pass
-            prev_th = getattr(self, '_vol_overlay_thread', None)
+            prev_th = self._vol_overlay_thread
             if prev_th is not None and prev_th.is_alive():
                 try:
                     prev_th.join(timeout=0.2)
@@ -719,16 +806,7 @@ class RGBMatrixPlugin(BasePlugin):
         except Exception:
             pass
 
-        # normalize color
-        try:
-            c = str(color or '#00FF00').strip()
-            if not c.startswith('#'):
-                c = '#' + c
-            if len(c) == 4:
-                c = '#' + c[1]*2 + c[2]*2 + c[3]*2
-            c = c.upper()
-        except Exception:
-            c = '#00FF00'
+        filled_color, empty_color = volume_bar_colors(color)
 
         m = str(mode or 'overlay').lower()
         if m not in ('overlay', 'pause'):
@@ -736,6 +814,13 @@ class RGBMatrixPlugin(BasePlugin):
 
         stop_ev = threading.Event()
         self._vol_overlay_stop = stop_ev
+        # overlay frames are built in a reused scratch list; only the runner
+        # reads it (set_pixels copies), so hand out a fresh one if an older
+        # runner outlived the join above and could still be using it
+        prev_th = self._vol_overlay_thread
+        if self._vol_scratch is None or (prev_th is not None and prev_th.is_alive()):
+            self._vol_scratch = []
+        scratch = self._vol_scratch
         try:
             self._vol_overlay_active = True
             self._vol_overlay_mode = m
@@ -744,70 +829,44 @@ class RGBMatrixPlugin(BasePlugin):
 
         def _runner():
             try:
+                # fixed deadline so the overlay duration does not drift with the work below
+                deadline = time.monotonic() + max(0, int(duration_ms)) / 1000.0
                 # snapshot current buffer
                 snap = self.get_pixels()
                 w = self.width
                 h = self.height
                 filled = int(round((v / 100.0) * w))
-                over = list(snap)
                 row_start = (h - 1) * w
+                bar = tuple([filled_color] * filled + [empty_color] * (w - filled))
+                over = scratch
+                over[:] = snap
+                over[row_start:row_start + w] = bar
                 try:
-                    hexc = c.lstrip('#')
-                    fr = int(hexc[0:2], 16); fg = int(hexc[2:4], 16); fb = int(hexc[4:6], 16)
-                except Exception:
-                    fr, fg, fb = 0, 255, 0
-                dr = max(0, int(fr * 0.12)); dg = max(0, int(fg * 0.12)); db = max(0, int(fb * 0.12))
-                filled_color = '#%02X%02X%02X' % (fr, fg, fb)
-                empty_color = '#%02X%02X%02X' % (dr, dg, db)
-                for x in range(w):
-                    idx = row_start + x
-                    if x < filled:
-                        over[idx] = filled_color
-                    else:
-                        over[idx] = empty_color
-                try:
-                    # store overlay pixels for merging by set_pixels
-                    try:
-                        self._vol_overlay_pixels = list(over)
-                    except Exception:
-                        self._vol_overlay_pixels = None
-                    # write overlay bypassing overlay check so it always appears
-                    try:
-                        self.set_pixels(over, bypass_overlay=True)
-                    except Exception:
-                        pass
+                    # publish the bar row (immutable) for merging by set_pixels,
+                    # then write the overlay bypassing the overlay check so it always appears
+                    self._vol_overlay_slice = slice(row_start, row_start + w)
+                    self._vol_overlay_pixels = bar
+                    self.set_pixels(over, bypass_overlay=True)
                 except Exception:
-                    pass
+                    log.exception('volume overlay write failed')
+                    self._vol_overlay_pixels = None
 
                 # wait for duration or stop
-                waited = 0.0
-                interval = 0.05
-                total = max(0, int(duration_ms) / 1000.0)
-                while not stop_ev.is_set() and waited < total:
-                    time.sleep(interval)
-                    waited += interval
+                cancelled = stop_ev.wait(max(0.0, deadline - time.monotonic()))
 
                 # restore snapshot if not cancelled
-                if not stop_ev.is_set():
+                if not cancelled:
                     try:
-                        try:
-                            self.set_pixels(snap, bypass_overlay=True)
-                        except Exception:
-                            pass
+                        self.set_pixels(snap, bypass_overlay=True)
                     except Exception:
-                        pass
+                        log.exception('volume overlay restore failed')
             finally:
-                try:
-                    self._vol_overlay_thread = None
-                    self._vol_overlay_stop = None
-                    self._vol_overlay_active = False
-                    self._vol_overlay_mode = 'overlay'
-                    try:
-                        self._vol_overlay_pixels = None
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
+                self._vol_overlay_thread = None
+                self._vol_overlay_stop = None
+                self._vol_overlay_active = False
+                self._vol_overlay_mode = 'overlay'
+                self._vol_overlay_pixels = None
+                self._vol_overlay_slice = None
 
         t = threading.Thread(target=_runner, daemon=True)
         self._vol_overlay_thread = t
@@ -829,21 +888,31 @@ class DisplayManager:
                 cfg = storage.load() or {}
         except Exception:
             cfg = {}
-        disp = cfg.get('display', {}) if isinstance(cfg, dict) else {}
+        # validate the loaded config once here so lookups below can use plain .get()
+        cfg = cfg if isinstance(cfg, dict) else {}
+        disp = cfg.get('display') or {}
         active = disp.get('active', 'ws2812')
-        plugins_cfg = disp.get('plugins', {}) if isinstance(disp, dict) else {}
+        plugins_cfg = disp.get('plugins') or {}
         self.set_active_plugin(active, plugins_cfg.get(active, {}))
 
-    def set_on_update(self, cb):
+    def set_on_update(self, cb, raw: bool = False):
         if self._plugin is not None:
             try:
-                self._plugin.set_on_update(cb)
+                self._plugin.set_on_update(cb, raw=raw)
             except Exception:
                 pass
 
     def set_active_plugin(self, name: str, cfg: Optional[Dict[str, Any]] = None):
         name = (name or 'ws2812')
         cfg = cfg or {}
+        # release the old plugin first: its writer thread and strip would
+        # otherwise keep driving the same pins / SPI device as the new one
+        old, self._plugin = self._plugin, None
+        if old is not None:
+            try:
+                old.cleanup()
+            except Exception:
+                log.exception('Failed to clean up display plugin')
         # Determine plugin-native size from cfg when available so the
         # Display page and API reflect the actual matrix dimensions.
         try:
@@ -879,6 +948,11 @@ class DisplayManager:
             return self._plugin.get_pixels()
         return ['#000000'] * (self.width * self.height)
 
+    def get_pixels_raw(self) -> bytes:
+        if self._plugin:
+            return self._plugin.get_pixels_raw()
+        return bytes(3 * self.width * self.height)
+
     def set_brightness(self, p: int):
         if self._plugin:
             try:
@@ -917,14 +991,14 @@ class DisplayManager:
             try:
                 return self._plugin.play_animation_from_gif(path, speed=speed, loop=loop)
             except Exception:
-                log.exception('play_animation_from_gif failed on plugin')
+                log_exception_throttled(log, 'display.play_animation_from_gif', 'play_animation_from_gif failed on plugin')
 
     def stop_animation(self):
         if self._plugin:
             try:
                 return self._plugin.stop_animation()
             except Exception:
-                log.exception('stop_animation failed on plugin')
+                log_exception_throttled(log, 'display.stop_animation', 'stop_animation failed on plugin')
 
     def pause_animation(self):
         if self._plugin:
@@ -932,7 +1006,7 @@ class DisplayManager:
                 if hasattr(self._plugin, 'pause_animation'):
                     return self._plugin.pause_animation()
             except Exception:
-                log.exception('pause_animation failed on plugin')
+                log_exception_throttled(log, 'display.pause_animation', 'pause_animation failed on plugin')
 
     def resume_animation(self):
         if self._plugin:
@@ -940,7 +1014,7 @@ class DisplayManager:
                 if hasattr(self._plugin, 'resume_animation'):
                     return self._plugin.resume_animation()
             except Exception:
-                log.exception('resume_animation failed on plugin')
+                log_exception_throttled(log, 'display.resume_animation', 'resume_animation failed on plugin')
 
     def is_animating(self) -> bool:
         if self._plugin:
@@ -950,7 +1024,7 @@ class DisplayManager:
                 return False
         return False
 
-    def show_volume_bar(self, volume: int, duration_ms: int = 1500, color: str = '#00FF00', mode: str = 'overlay'):
+    def show_volume_bar(self, volume: int, duration_ms: int = _VOL_DEFAULT_MS, color: str = '#00FF00', mode: str = 'overlay'):
         if self._plugin:
             try:
                 return self._plugin.show_volume_bar(volume, duration_ms=duration_ms, color=color, mode=mode)
@@ -10,16 +10,25 @@ API:
  - create_matrix(width=None, height=None, config=None) -> matrix object with get_pixels()/set_pixels()
  - config dict can contain 'width' and 'height' keys (preferred over positional args)
  - get_pixels() returns list of hex strings length width*height (row-major)
+ - get_pixels_raw() returns the same buffer as packed RGB bytes (3 per pixel)
  - set_pixels(list_of_hex) accepts row-major list or a nested list
+
+Internally the buffer is kept as packed row-major RGB bytes (3 per pixel);
+hex strings are only produced/parsed at the API boundary.
 """
 from __future__ import annotations
 
+import functools
+import itertools
+import operator
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import threading
 import time
 from pathlib import Path
-from utils.logging_config import get_logger
+from utils.logging_config import get_logger, log_exception_throttled
+from ._pixelfmt import (coerce_color, parse_hex_list, format_hex_list, pack_rgb_u32, volume_bar_colors,
+                        led_setter, write_leds)
 
 log = get_logger(__name__)
 
@@ -40,6 +49,8 @@ except Exception:
     ws = None
     _HAVE_WS = False
 
+from .ws2812_spi import SpiStrip, _HAVE_SPIDEV
+
 
 class LEDMatrix:
     def __init__(self, width: Optional[int] = None, height: Optional[int] = None, config: Optional[dict] = None):
@@ -58,6 +69,8 @@ class LEDMatrix:
                 - brightness: Initial brightness 0-255 (default: 64)
                 - channel: PWM channel (default: 0)
                 - serpentine: Serpentine wiring pattern (default: False)
+                - backend: 'pwm' (rpi_ws281x, default) or 'spi' (spidev, data on MOSI)
+                - spi_bus / spi_device: SPI device for the 'spi' backend (default: 0/0)
         """
         # Use config dict or fallback to environment variables or defaults
         cfg = config or {}
@@ -66,12 +79,67 @@ class LEDMatrix:
         self.width = int(cfg.get('width', width or int(os.environ.get('LED_WIDTH', '16'))))
         self.height = int(cfg.get('height', height or int(os.environ.get('LED_HEIGHT', '16'))))
         
-        # row-major buffer, initial black
-        self._buf: List[str] = ['#000000'] * (self.width * self.height)
+        # row-major packed RGB buffer (3 bytes per pixel), initial black
+        self._buf = bytearray(3 * self.width * self.height)
+        # 0x00RRGGBB scratch for the hardware write; the pad byte stays zero
+        self._hw_scratch = bytearray(4 * self.width * self.height)
+        # volume overlay state (see show_volume_bar) and update listener
+        self._vol_overlay_active = False
+        self._vol_overlay_mode = 'overlay'
+        self._vol_overlay_pixels = None
+        self._vol_overlay_slice = None
+        self._vol_overlay_stop = None
+        self._vol_overlay_thread = None
+        # scratch list reused by show_volume_bar to build the overlay frame
+        self._vol_scratch = None
+        self._on_update = None
+        # when set, _on_update receives packed RGB bytes instead of hex strings
+        self._on_update_raw = False
+        # serpentine wiring: odd rows run right-to-left. The physical LED index
+        # for each row-major pixel is computed once here for the write loop.
+        serpentine_val = cfg.get('serpentine', os.environ.get('LED_SERPENTINE', '0'))
+        self._serpentine = serpentine_val in (True, 1, '1', 'true', 'True')
+        self._phys_idx = _physical_index(self.width, self.height, self._serpentine)
+        # initial brightness (0-255 for the driver, percent for the API), parsed once
+        brightness = int(cfg.get('brightness', os.environ.get('LED_BRIGHTNESS', '64')))
+        self._brightness = brightness
+        self._brightness_percent = int(brightness * 100 / 255)
         # hardware handle if available
         self._hw = None
+        # (index, color) setter bound to the hardware strip, see led_setter()
+        self._hw_set = None
+        # hardware writes run on a writer thread; set_pixels leaves the newest
+        # frame in _tx_frame and callers never wait for the strip transmit
+        self._tx_frame = None
+        self._tx_last = None
+        self._tx_ready = threading.Event()
+        self._tx_stop = threading.Event()
+        self._tx_thread = None
+        # brightness changes are applied by the writer thread too; the strip
+        # is only ever touched from there once it is running
+        self._tx_brightness = brightness
+        self._tx_brightness_applied = brightness
+        # SPI backend: row-major RGB -> physical GRB byte gather, see _grb_gather()
+        self._spi_gather = None
+        backend = str(cfg.get('backend', os.environ.get('LED_BACKEND', 'pwm'))).lower()
+        if backend == 'spi':
+            if _HAVE_SPIDEV:
+                try:
+                    bus = int(cfg.get('spi_bus', os.environ.get('LED_SPI_BUS', '0')))
+                    device = int(cfg.get('spi_device', os.environ.get('LED_SPI_DEVICE', '0')))
+                    strip = SpiStrip(self.width * self.height, bus, device, brightness)
+                    strip.begin()
+                    self._hw = strip
+                    self._spi_gather = _grb_gather(self._phys_idx)
+                    self._start_writer()
+                    log.info('LED matrix SPI hardware initialized: %dx%d on spidev%d.%d', self.width, self.height, bus, device)
+                except Exception:
+                    log.exception('Failed to initialize SPI LED strip')
+                    self._hw = None
+            else:
+                log.warning('LED backend "spi" requested but spidev is not installed')
         # If rpi_ws281x is available, attempt to initialize hardware
-        if _HAVE_WS:
+        elif _HAVE_WS:
             try:
                 # Configuration-driven setup with fallbacks to env vars then defaults
                 num = self.width * self.height
@@ -79,11 +147,7 @@ class LEDMatrix:
                 freq = int(cfg.get('freq_hz', os.environ.get('LED_FREQ_HZ', '800000')))
                 dma = int(cfg.get('dma', os.environ.get('LED_DMA', '10')))
                 invert = bool(cfg.get('invert', int(os.environ.get('LED_INVERT', '0'))))
-                brightness = int(cfg.get('brightness', os.environ.get('LED_BRIGHTNESS', '64')))
                 channel = int(cfg.get('channel', os.environ.get('LED_CHANNEL', '0')))
-                serpentine_val = cfg.get('serpentine', os.environ.get('LED_SERPENTINE', '0'))
-                serpentine = serpentine_val in (True, 1, '1', 'true', 'True')
-                self._serpentine = serpentine
                 # Optionally provide strip type name (not required)
                 strip_type = None
                 try:
@@ -91,6 +155,8 @@ class LEDMatrix:
                     strip = ws.PixelStrip(num, pin, freq, dma, invert, brightness, channel, strip_type)
                     strip.begin()
                     self._hw = strip
+                    self._hw_set = led_setter(strip)
+                    self._start_writer()
                     log.info('LED matrix hardware initialized: %dx%d on pin %s', self.width, self.height, pin)
                 except Exception:
                     log.exception('Failed to initialize LED PixelStrip hardware')
@@ -99,9 +165,88 @@ class LEDMatrix:
                 log.exception('LED hardware init failed')
                 self._hw = None
 
+    def _start_writer(self):
+        if self._tx_thread is None:
+            self._tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+            self._tx_thread.start()
+
+    def _queue_hw(self, raw: bytes):
+        """Queue a packed RGB frame for the writer thread (newest frame wins)."""
+        self._tx_frame = raw
+        self._tx_ready.set()
+
+    def _tx_loop(self):
+        while not self._tx_stop.is_set():
+            self._tx_ready.wait()
+            self._tx_ready.clear()
+            if self._tx_stop.is_set():
+                break
+            raw = self._tx_frame
+            bri = self._tx_brightness
+            if bri != self._tx_brightness_applied and self._hw is not None:
+                try:
+                    self._hw.setBrightness(bri)
+                except Exception:
+                    log.exception('Failed to set hardware brightness')
+                self._tx_brightness_applied = bri
+                # the new level only reaches the LEDs with a frame push and
+                # show(), so the unchanged-frame skip must not apply
+                self._tx_last = None
+                if raw is None:
+                    raw = bytes(self._buf)
+            # an unchanged frame (steady animation, UI re-sends) would only
+            # repeat the strip transmit, so skip it
+            if raw is not None and self._hw is not None and raw != self._tx_last:
+                self._write_hw(raw)
+                self._tx_last = raw
+
+    def close(self):
+        """Stop the writer thread and release the strip."""
+        self._tx_stop.set()
+        self._tx_ready.set()
+        if self._tx_thread is not None:
+            self._tx_thread.join(timeout=1.0)
+            self._tx_thread = None
+        hw, self._hw = self._hw, None
+        self._hw_set = None
+        # SpiStrip holds an open spidev handle; PixelStrip frees itself
+        if hw is not None and hasattr(hw, 'close'):
+            try:
+                hw.close()
+            except Exception:
+                log.exception('Error closing LED strip')
+
+    def _write_hw(self, raw: bytes):
+        """Push a packed RGB frame to the strip and show it; errors are logged."""
+        try:
+            if self._spi_gather is not None:
+                # SPI strips take the whole frame at once in physical GRB order
+                self._hw.set_grb(self._spi_gather(raw))
+                self._hw.show()
+                return
+            # Map row-major buffer to physical LED indices (precomputed so
+            # serpentine wiring from LED_SERPENTINE costs nothing per frame).
+            # Colors are packed as 0x00RRGGBB, the same value ws.Color() builds.
+            set_pixel = self._hw_set or self._hw.setPixelColor
+            # one handler per frame: a failing write repeats for every pixel
+            try:
+                write_leds(set_pixel, self._phys_idx, pack_rgb_u32(raw, self._hw_scratch))
+            except Exception:
+                log_exception_throttled(log, 'ledmatrix.set_pixel', 'Error writing pixels to LED strip')
+            try:
+                self._hw.show()
+            except Exception:
+                log.exception('Error calling show() on LED strip')
+        except Exception:
+            log.exception('Error writing to LED matrix hardware')
+
     def get_pixels(self) -> List[str]:
         """Return row-major list of hex colors (#RRGGBB)."""
-        return list(self._buf)
+        return format_hex_list(self._buf)
+
+    def get_pixels_raw(self) -> bytes:
+        """Return a copy of the packed row-major RGB buffer (3 bytes per pixel)."""
+        return bytes(self._buf)
 
     def set_brightness(self, percent: int):
         """Set brightness as a percentage 0-100. Applies to hardware if present."""
@@ -114,21 +259,15 @@ class LEDMatrix:
         bri = int(p * 255 / 100)
         self._brightness_percent = p
         self._brightness = bri
-        if self._hw is not None:
-            try:
-                # PixelStrip exposes setBrightness
-                if hasattr(self._hw, 'setBrightness'):
-                    self._hw.setBrightness(bri)
-                    try:
-                        self._hw.show()
-                    except Exception:
-                        pass
-            except Exception:
-                log.exception('Failed to set hardware brightness')
+        # PixelStrip exposes setBrightness; the writer thread applies it
+        # before the next show() so it never races a frame transmit
+        if self._hw is not None and hasattr(self._hw, 'setBrightness'):
+            self._tx_brightness = bri
+            self._tx_ready.set()
 
     def get_brightness(self) -> int:
         """Return brightness as percentage 0-100."""
-        return int(getattr(self, '_brightness_percent', int(os.environ.get('LED_BRIGHTNESS', '64')) * 100 / 255))
+        return self._brightness_percent
 
     # --- Animation support ---
     # Animation playback moved into the display manager plugin layer (BasePlugin).
@@ -137,8 +276,6 @@ class LEDMatrix:
 
     # stop_animation handled by BasePlugin in the plugin layer
 
-    # WLED JSON animation playback moved to the plugin layer (BasePlugin).
-
     # is_animating handled by BasePlugin in the plugin layer
 
     def show_volume_bar(self, volume: int, duration_ms: int = 1500, color: str = '#00FF00', mode: str = 'overlay'):
@@ -159,13 +296,13 @@ class LEDMatrix:
 
         # stop any existing overlay
         try:
-            prev_ev = getattr(self, '_vol_overlay_stop', None)
+            prev_ev = self._vol_overlay_stop
             if prev_ev is not None:
                 try:
                     prev_ev.set()
                 except Exception:
                     pass
-            prev_th = getattr(self, '_vol_overlay_thread', None)
+            prev_th = self._vol_overlay_thread
             if prev_th is not None and prev_th.is_alive():
                 try:
                     prev_th.join(timeout=0.2)
@@ -174,17 +311,8 @@ class LEDMatrix:
         except Exception:
             pass
 
-        # normalize color
-        try:
-            c = str(color or '#00FF00').strip()
-            if not c.startswith('#'):
-                c = '#' + c
-            # normalize 3-char to 6-char
-            if len(c) == 4:
-                c = '#' + c[1]*2 + c[2]*2 + c[3]*2
-            c = c.upper()
-        except Exception:
-            c = '#00FF00'
+        # bar fill and remainder colors
+        filled_color, empty_color = volume_bar_colors(color)
 
         # normalize mode
         m = str(mode or 'overlay').lower()
@@ -193,6 +321,13 @@ class LEDMatrix:
 
         stop_ev = threading.Event()
         self._vol_overlay_stop = stop_ev
+        # overlay frames are built in a reused scratch list; only the runner
+        # reads it (set_pixels copies), so hand out a fresh one if an older
+        # runner outlived the join above and could still be using it
+        prev_th = self._vol_overlay_thread
+        if self._vol_scratch is None or (prev_th is not None and prev_th.is_alive()):
+            self._vol_scratch = []
+        scratch = self._vol_scratch
         # mark overlay active and mode so other writes can respect 'pause'
         try:
             self._vol_overlay_active = True
@@ -202,73 +337,46 @@ class LEDMatrix:
 
         def _runner():
             try:
+                # fixed deadline so the overlay duration does not drift with the work below
+                deadline = time.monotonic() + max(0, int(duration_ms)) / 1000.0
                 # snapshot current buffer
-                snap = list(self._buf)
+                snap = self.get_pixels()
                 w = self.width
                 h = self.height
                 filled = int(round((v / 100.0) * w))
-                # build overlay copy
-                over = list(snap)
                 row_start = (h - 1) * w
-                # compute fill color and remainder color
-                try:
-                    hexc = c.lstrip('#')
-                    fr = int(hexc[0:2], 16); fg = int(hexc[2:4], 16); fb = int(hexc[4:6], 16)
-                except Exception:
-                    fr, fg, fb = 0, 255, 0
-                # darker remainder color
-                dr = max(0, int(fr * 0.12)); dg = max(0, int(fg * 0.12)); db = max(0, int(fb * 0.12))
-                filled_color = '#%02X%02X%02X' % (fr, fg, fb)
-                empty_color = '#%02X%02X%02X' % (dr, dg, db)
-                for x in range(w):
-                    idx = row_start + x
-                    if x < filled:
-                        over[idx] = filled_color
-                    else:
-                        over[idx] = empty_color
+                bar = tuple([filled_color] * filled + [empty_color] * (w - filled))
+                over = scratch
+                over[:] = snap
+                over[row_start:row_start + w] = bar
                 try:
-                    # write overlay
-                    # bypass overlay blocking so overlay can always write
-                    # store overlay pixels so other writers can merge when overlay is active
-                    try:
-                        self._vol_overlay_pixels = list(over)
-                    except Exception:
-                        self._vol_overlay_pixels = None
+                    # publish the bar row (immutable) so other writers can merge it when
+                    # the overlay is active, then write overlay bypassing overlay blocking
+                    self._vol_overlay_slice = slice(row_start, row_start + w)
+                    self._vol_overlay_pixels = bar
                     self.set_pixels(over, bypass_overlay=True)
                 except Exception:
-                    pass
+                    log.exception('volume overlay write failed')
+                    self._vol_overlay_pixels = None
 
                 # wait for duration or stop
-                waited = 0
-                interval = 0.05
-                total = max(0, int(duration_ms) / 1000.0)
-                while not stop_ev.is_set() and waited < total:
-                    time.sleep(interval)
-                    waited += interval
+                cancelled = stop_ev.wait(max(0.0, deadline - time.monotonic()))
 
                 # restore snapshot if overlay not cancelled
-                if not stop_ev.is_set():
+                if not cancelled:
                     try:
-                        try:
-                            # restore snapshot; bypass overlay blocking so restore always succeeds
-                            self.set_pixels(snap, bypass_overlay=True)
-                        except Exception:
-                            pass
+                        # restore snapshot; bypass overlay blocking so restore always succeeds
+                        self.set_pixels(snap, bypass_overlay=True)
                     except Exception:
-                        pass
+                        log.exception('volume overlay restore failed')
             finally:
-                try:
-                    # clear active flag and thread refs
-                    self._vol_overlay_thread = None
-                    self._vol_overlay_stop = None
-                    self._vol_overlay_active = False
-                    self._vol_overlay_mode = 'overlay'
-                    try:
-                        self._vol_overlay_pixels = None
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
+                # clear active flag and thread refs
+                self._vol_overlay_thread = None
+                self._vol_overlay_stop = None
+                self._vol_overlay_active = False
+                self._vol_overlay_mode = 'overlay'
+                self._vol_overlay_pixels = None
+                self._vol_overlay_slice = None
 
         t = threading.Thread(target=_runner, daemon=True)
         self._vol_overlay_thread = t
@@ -281,21 +389,14 @@ class LEDMatrix:
         will be coerced where possible; missing cells are left black.
         """
         # If a volume overlay is active in 'pause' mode, block writes unless bypass_overlay is True
-        try:
-            if getattr(self, '_vol_overlay_active', False) and not bypass_overlay and getattr(self, '_vol_overlay_mode', 'overlay') == 'pause':
-                return
-        except Exception:
-            pass
+        if self._vol_overlay_active and not bypass_overlay and self._vol_overlay_mode == 'pause':
+            return
         if pixels is None:
             return
-        flat: List[str] = []
         # nested list
         if isinstance(pixels, list) and len(pixels) and isinstance(pixels[0], list):
-            for row in pixels:
-                for v in row:
-                    flat.append(self._coerce_color(v))
-        else:
-            flat = [self._coerce_color(v) for v in pixels]
+            pixels = itertools.chain.from_iterable(pixels)
+        flat: List[str] = list(map(self._coerce_color, pixels))
 
         # resize or clamp
         expected = self.width * self.height
@@ -308,86 +409,56 @@ class LEDMatrix:
         # If an overlay is active in 'overlay' mode and this write is not explicitly bypassing,
         # merge the overlay pixels onto the new buffer so the overlay remains visible.
         try:
-            if getattr(self, '_vol_overlay_active', False) and not bypass_overlay and getattr(self, '_vol_overlay_mode', 'overlay') == 'overlay':
-                overpix = getattr(self, '_vol_overlay_pixels', None)
-                if isinstance(overpix, list) and len(overpix) == expected:
-                    for i, v in enumerate(overpix):
-                        try:
-                            if v and v != '#000000':
-                                flat[i] = v
-                        except Exception:
-                            continue
+            if self._vol_overlay_active and not bypass_overlay and self._vol_overlay_mode == 'overlay':
+                overpix = self._vol_overlay_pixels
+                sl = self._vol_overlay_slice
+                if overpix is not None and sl is not None:
+                    # the overlay is just the bar row
+                    flat[sl] = overpix
         except Exception:
             pass
 
-        self._buf = flat
+        # parse the whole frame once; hardware and readers use the packed bytes
+        raw = parse_hex_list(flat)
+        self._buf[:] = raw
 
-        # If hardware backing is present, attempt to write; ignore errors.
+        # If hardware backing is present, hand the frame to the writer thread;
+        # a frame that has not been sent yet is replaced by the newer one.
         if self._hw is not None:
-            try:
-                # Map row-major buffer to physical LED indices. Support simple
-                # serpentine wiring if requested via env LED_SERPENTINE.
-                for y in range(self.height):
-                    row_start = y * self.width
-                    row = self._buf[row_start:row_start + self.width]
-                    if getattr(self, '_serpentine', False) and (y % 2 == 1):
-                        row_iter = list(reversed(row))
-                    else:
-                        row_iter = row
-                    for x, col in enumerate(row_iter):
-                        # compute physical index
-                        phys_x = x if not (getattr(self, '_serpentine', False) and (y % 2 == 1)) else (self.width - 1 - x)
-                        idx = y * self.width + phys_x
-                        # parse hex color
-                        try:
-                            hexc = col.lstrip('#')
-                            r = int(hexc[0:2], 16)
-                            g = int(hexc[2:4], 16)
-                            b = int(hexc[4:6], 16)
-                        except Exception:
-                            r, g, b = 0, 0, 0
-                        try:
-                            color = ws.Color(r, g, b) if ws is not None else ((r << 16) | (g << 8) | b)
-                            self._hw.setPixelColor(idx, color)
-                        except Exception:
-                            # Some libraries expect different ordering; ignore per-pixel errors
-                            pass
-                try:
-                    self._hw.show()
-                except Exception:
-                    log.exception('Error calling show() on LED strip')
-            except Exception:
-                log.exception('Error writing to LED matrix hardware')
+            self._queue_hw(raw)
         # Notify any listener (e.g., websocket broadcaster) about the new buffer
         try:
-            cb = getattr(self, '_on_update', None)
+            cb = self._on_update
             if cb:
                 try:
-                    cb(list(self._buf))
+                    cb(raw if self._on_update_raw else format_hex_list(raw))
                 except Exception:
                     log.exception('LEDMatrix on_update callback raised')
         except Exception:
             pass
 
-    @staticmethod
-    def _coerce_color(v) -> str:
-        try:
-            if v is None:
-                return '#000000'
-            s = str(v).strip()
-            if s.startswith('#') and (len(s) == 7 or len(s) == 4):
-                # normalize 3-char to 6-char
-                if len(s) == 4:
-                    r = s[1]*2; g = s[2]*2; b = s[3]*2
-                    return f'#{r}{g}{b}'.upper()
-                return s.upper()
-            # allow integer RGB tuple like '255,0,0' or (255,0,0)
-            if ',' in s:
-                parts = [int(p.strip()) for p in s.split(',')]
-                return '#%02X%02X%02X' % (parts[0], parts[1], parts[2])
-            return '#000000'
-        except Exception:
-            return '#000000'
+    _coerce_color = staticmethod(coerce_color)
+
+
+def _grb_gather(phys_idx) -> operator.itemgetter:
+    """Return an itemgetter taking row-major RGB bytes to GRB bytes in physical LED order."""
+    perm = [0] * (3 * len(phys_idx))
+    for i, p in enumerate(phys_idx):
+        perm[3 * p:3 * p + 3] = (3 * i + 1, 3 * i, 3 * i + 2)
+    return operator.itemgetter(*perm)
+
+
+@functools.lru_cache(maxsize=8)
+def _physical_index(width: int, height: int, serpentine: bool) -> Tuple[int, ...]:
+    """Return the physical LED index for each row-major pixel.
+
+    With serpentine wiring every odd row runs right-to-left.
+    """
+    idx: List[int] = []
+    for y in range(height):
+        row = range(y * width, (y + 1) * width)
+        idx.extend(reversed(row) if serpentine and y % 2 == 1 else row)
+    return tuple(idx)
 
 
 def create_matrix(width: Optional[int] = None, height: Optional[int] = None, config: Optional[dict] = None) -> LEDMatrix:
@@ -421,27 +492,14 @@ def write_hw_buffer(hw, flat_pixels, width, height, serpentine=False):
         if len(flat_pixels) > num:
             flat_pixels = flat_pixels[:num]
 
-        for y in range(height):
-            row_start = y * width
-            row = flat_pixels[row_start:row_start + width]
-            if serpentine and (y % 2 == 1):
-                row_iter = list(reversed(row))
-            else:
-                row_iter = row
-            for x, col in enumerate(row_iter):
-                phys_x = x if not (serpentine and (y % 2 == 1)) else (width - 1 - x)
-                idx = y * width + phys_x
-                try:
-                    hexc = col.lstrip('#')
-                    r = int(hexc[0:2], 16); g = int(hexc[2:4], 16); b = int(hexc[4:6], 16)
-                except Exception:
-                    r, g, b = 0, 0, 0
-                try:
-                    color = ws.Color(r, g, b) if ws is not None else ((r << 16) | (g << 8) | b)
-                    hw.setPixelColor(idx, color)
-                except Exception:
-                    # per-pixel write errors are ignorable
-                    pass
+        # decode the whole frame at once (see _pixelfmt) instead of int(..., 16) per channel
+        colors = pack_rgb_u32(parse_hex_list(flat_pixels))
+        set_pixel = led_setter(hw)
+        # one handler per frame: a failing write repeats for every pixel
+        try:
+            write_leds(set_pixel, _physical_index(width, height, bool(serpentine)), colors)
+        except Exception:
+            log_exception_throttled(log, 'ledmatrix.set_pixel', 'Error writing pixels to LED strip')
         try:
             hw.show()
         except Exception:
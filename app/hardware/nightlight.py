@@ -2,13 +2,27 @@
 WS2812B Nightlight Controller
 Controls an LED strip for ambient lighting (separate from the display matrix)
 """
+import functools
+import itertools
 import os
 import threading
 import time
 from utils.logging_config import get_logger
+from ._pixelfmt import led_setter, write_leds
+from .ws2812_spi import SpiStrip, _HAVE_SPIDEV
 
 log = get_logger(__name__)
 
+# bursts of set_state() calls are coalesced into one strip write per window
+_WRITE_COALESCE_SEC = 0.016
+
+
+@functools.lru_cache(maxsize=128)
+def _hex_to_rgb(hex_color):
+    """Convert hex color string to RGB tuple."""
+    r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
+    return r, g, b
+
 
 class NightLight:
     def __init__(self, num_leds=None, gpio_pin=None):
@@ -21,6 +35,8 @@ class NightLight:
         """
         self.num_leds = num_leds or int(os.environ.get('LED_NIGHTLIGHT_COUNT', '30'))
         self.gpio_pin = gpio_pin or int(os.environ.get('LED_NIGHTLIGHT_PIN', '18'))
+        # 'pwm' (rpi_ws281x) or 'spi' (whole strip in one SPI transfer)
+        self.backend = os.environ.get('LED_NIGHTLIGHT_BACKEND', 'pwm').lower()
         
         self._state = {
             'on': False,
@@ -29,19 +45,44 @@ class NightLight:
         }
         
         self._strip = None
-        self._lock = threading.RLock()  # Use RLock to allow recursive locking
-        self._state_callbacks = []
+        self._led_set = None
+        # packed strip colour for the current state (0 when off), kept up to
+        # date by set_state so a strip write needs no colour maths
+        self._cached_packed = 0
+        # last (colour, brightness) sent to the strip; identical writes are skipped
+        self._last_written = (None, None)
+        self._lock = threading.Lock()  # guards _state and _cached_packed
+        # serializes strip writes, which run outside _lock
+        self._strip_lock = threading.Lock()
+        # copy-on-write tuple, so notifying never races a registration
+        self._state_callbacks = ()
+        # set_state() records the change and wakes the writer thread, which
+        # drives the strip and notifies callbacks at most once per window
+        self._pending_event = threading.Event()
+        self._writer_stop = threading.Event()
+        self._writer_thread = None
         
         # Try to initialize the LED strip
         try:
             self._init_strip()
-            log.info('Nightlight initialized: %d LEDs on GPIO %d', self.num_leds, self.gpio_pin)
+            if isinstance(self._strip, SpiStrip):
+                log.info('Nightlight initialized: %d LEDs on SPI', self.num_leds)
+            else:
+                log.info('Nightlight initialized: %d LEDs on GPIO %d', self.num_leds, self.gpio_pin)
         except Exception as e:
             log.warning('Could not initialize nightlight hardware: %s', e)
             log.info('Nightlight will run in simulation mode')
+        
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
     
     def _init_strip(self):
         """Initialize the WS2812B LED strip using rpi_ws281x library."""
+        if self.backend == 'spi':
+            if _HAVE_SPIDEV:
+                self._init_spi_strip()
+                return
+            log.warning('LED_NIGHTLIGHT_BACKEND=spi but spidev is not installed; using rpi_ws281x')
         try:
             from rpi_ws281x import PixelStrip, Color
             
@@ -63,6 +104,7 @@ class NightLight:
             
             self._strip.begin()
             self._Color = Color  # Store Color constructor for later use
+            self._led_set = led_setter(self._strip)
             
             # Turn off all LEDs initially
             self._update_strip()
@@ -74,37 +116,72 @@ class NightLight:
             log.error('Error initializing WS2812B strip: %s', e)
             raise
     
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex color string to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    def _init_spi_strip(self):
+        """Initialize the strip on the SPI bus (data line on MOSI)."""
+        bus = int(os.environ.get('LED_NIGHTLIGHT_SPI_BUS', '0'))
+        device = int(os.environ.get('LED_NIGHTLIGHT_SPI_DEVICE', '0'))
+        try:
+            self._strip = SpiStrip(self.num_leds, bus, device, self._state['brightness'])
+            self._strip.begin()
+        except Exception as e:
+            self._strip = None
+            log.error('Error initializing SPI WS2812B strip: %s', e)
+            raise
+        self._Color = lambda r, g, b: (r << 16) | (g << 8) | b
+        
+        # Turn off all LEDs initially
+        self._update_strip()
     
     def _update_strip(self):
         """Update the physical LED strip with current state."""
         if not self._strip:
             return  # Simulation mode
         
-        with self._lock:
-            if self._state['on']:
-                r, g, b = self._hex_to_rgb(self._state['color'])
-                brightness = self._state['brightness']
-                
-                # Apply brightness scaling
-                r = int(r * brightness / 255)
-                g = int(g * brightness / 255)
-                b = int(b * brightness / 255)
-                
-                color = self._Color(r, g, b)
-                
-                # Set all LEDs to the same color
-                for i in range(self.num_leds):
-                    self._strip.setPixelColor(i, color)
-            else:
-                # Turn off all LEDs
-                for i in range(self.num_leds):
-                    self._strip.setPixelColor(i, 0)
+        with self._strip_lock:
+            # written without _lock so get_state()/set_state() are not
+            # blocked on the strip transmit
+            color = self._cached_packed
+            brightness = self._state['brightness']
+            last_color, last_brightness = self._last_written
+            if color == last_color and (brightness == last_brightness or not color):
+                return
+            
+            # the driver scales by brightness while rendering the frame
+            if brightness != last_brightness:
+                self._strip.setBrightness(brightness)
             
+            # Set all LEDs to the same color
+            n = self.num_leds
+            if self._led_set is None:
+                # SPI strip: one GRB triple repeated for the whole frame
+                self._strip.set_grb(bytes(((color >> 8) & 0xFF, (color >> 16) & 0xFF, color & 0xFF)) * n)
+            else:
+                write_leds(self._led_set, range(n), itertools.repeat(color, n))
             self._strip.show()
+            self._last_written = (color, brightness)
+    
+    def _writer_loop(self):
+        """Apply pending state changes to the strip and callbacks."""
+        # re-checked after each pass so a stop that lands mid-pass still
+        # exits once the final state is written
+        while not self._writer_stop.is_set():
+            self._pending_event.wait()
+            if not self._writer_stop.is_set():
+                time.sleep(_WRITE_COALESCE_SEC)
+            self._pending_event.clear()
+            try:
+                self._update_strip()
+            except Exception:
+                log.exception('Error updating nightlight strip')
+            self._notify_callbacks(self.get_state())
+    
+    def _pack_color(self):
+        """Return the strip colour for the current state; caller holds _lock."""
+        if not self._state['on']:
+            return 0  # Turn off all LEDs
+        # brightness is applied by the strip driver, see _update_strip()
+        r, g, b = _hex_to_rgb(self._state['color'])
+        return self._Color(r, g, b)
     
     def get_state(self):
         """Get current nightlight state."""
@@ -142,11 +219,16 @@ class NightLight:
                     self._state['brightness'] = brightness
                     changed = True
             
-            if changed:
-                self._update_strip()
-                self._notify_callbacks()
+            # a brightness-only change leaves the packed colour as it is
+            if changed and self._strip is not None:
+                self._cached_packed = self._pack_color()
             
-            return self._state.copy()
+            state = self._state.copy()
+        
+        if changed:
+            self._pending_event.set()
+        
+        return state
     
     def turn_on(self):
         """Turn on the nightlight."""
@@ -169,11 +251,10 @@ class NightLight:
         Register a callback to be called when state changes.
         Callback will be called with the new state dict as argument.
         """
-        self._state_callbacks.append(callback)
+        self._state_callbacks = self._state_callbacks + (callback,)
     
-    def _notify_callbacks(self):
+    def _notify_callbacks(self, state):
         """Notify all registered callbacks of state change."""
-        state = self._state.copy()
         for callback in self._state_callbacks:
             try:
                 callback(state)
@@ -186,3 +267,8 @@ class NightLight:
             self.turn_off()
         except Exception:
             pass
+        # let the writer flush the final state, then exit
+        self._writer_stop.set()
+        self._pending_event.set()
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout=1.0)
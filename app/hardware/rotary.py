@@ -1,7 +1,8 @@
 """
 Simple rotary encoder reader that works on Raspberry Pi using RPi.GPIO.
 
-The module provides RotaryEncoderReader which polls the two GPIO pins and
+The module provides RotaryEncoderReader which watches the two GPIO pins for
+edges (falling back to polling when edge detection is unavailable) and
 decodes quadrature transitions. It calls a user-provided callback with an
 integer delta (positive for clockwise, negative for counter-clockwise)
 measured in detents. The reader accumulates raw transitions and only calls
@@ -12,6 +13,9 @@ can run on non-Pi systems.
 """
 from __future__ import annotations
 
+import mmap
+import os
+import struct
 import threading
 import time
 import logging
@@ -26,6 +30,27 @@ except Exception:
     GPIO = None
     _HAVE_RPI = False
 
+# BCM283x GPIO pin level register for pins 0-31, as an offset into /dev/gpiomem
+_GPLEV0 = 0x34
+_U32 = struct.Struct('<I')
+
+# real-time priority for the polling thread (needs root or CAP_SYS_NICE)
+_POLL_RT_PRIORITY = 20
+
+
+def _raise_thread_priority():
+    """Run the calling thread under SCHED_FIFO, or at least a lower nice value."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_POLL_RT_PRIORITY))
+        return
+    except (AttributeError, OSError):
+        pass
+    try:
+        # Linux applies nice to the calling thread only
+        os.nice(-10)
+    except (AttributeError, OSError):
+        log.debug('Could not raise rotary poll thread priority; polling at normal priority')
+
 
 class RotaryEncoderReader:
     def __init__(self, pin_a: int, pin_b: int, callback: Callable[[int], None], *, poll_interval: float = 0.01, reverse: bool = False, steps_per_detent: int = 4, button_pin: Optional[int] = None, button_callback: Optional[Callable[[], None]] = None, button_debounce: float = 0.15):
@@ -33,7 +58,7 @@ class RotaryEncoderReader:
 
         - pin_a, pin_b: BCM pin numbers for the encoder A/B channels.
         - callback: function called with integer detent delta (e.g. +1 / -1).
-        - poll_interval: seconds between polls (default 10ms).
+        - poll_interval: seconds between polls when edge detection is unavailable (default 10ms).
         - reverse: if True, invert direction.
         - steps_per_detent: number of quadrature transitions that make one detent.
         """
@@ -47,13 +72,24 @@ class RotaryEncoderReader:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._accumulator = 0
+        # True while GPIO edge callbacks drive decoding instead of the poll thread
+        self._edge_mode = False
+        # edge callbacks for A and B may interleave; guards decoder state
+        self._lock = threading.Lock()
+        # bounce filter: transitions faster than a physical detent allows, or
+        # reversing direction right after a step, are contact bounce
+        self._last_edge_ns = 0
+        self._last_dir = 0
+        self._min_period_ns = 1000000
+        self._reverse_guard_ns = 3000000
 
         # optional button pin
         self.button_pin = int(button_pin) if button_pin is not None else None
         self.button_callback = button_callback
         self.button_debounce = float(button_debounce)
+        self._button_debounce_ns = int(self.button_debounce * 1e9)
         self._last_button_state = 1
-        self._last_button_time = 0.0
+        self._last_button_time_ns = 0
 
         # last state is a 2-bit number (A<<1 | B)
         self._last_state = 0
@@ -67,7 +103,7 @@ class RotaryEncoderReader:
                 if self.button_pin is not None:
                     GPIO.setup(self.button_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
                     self._last_button_state = 1 if GPIO.input(self.button_pin) else 0
-                    self._last_button_time = 0.0
+                    self._last_button_time_ns = 0
                 # initialize last state
                 a = GPIO.input(self.pin_a)
                 b = GPIO.input(self.pin_b)
@@ -84,6 +120,18 @@ class RotaryEncoderReader:
         if self._running:
             return
         self._running = True
+        # let the kernel wake us on real edges; poll only if edge detection
+        # is unavailable (e.g. interrupts disabled for these pins)
+        try:
+            GPIO.add_event_detect(self.pin_a, GPIO.BOTH, callback=self._on_edge)
+            GPIO.add_event_detect(self.pin_b, GPIO.BOTH, callback=self._on_edge)
+            if self.button_pin is not None:
+                GPIO.add_event_detect(self.button_pin, GPIO.BOTH, callback=self._on_button)
+            self._edge_mode = True
+            return
+        except Exception:
+            log.warning('GPIO edge detection unavailable for rotary encoder; falling back to polling', exc_info=True)
+            self._remove_event_detect()
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
@@ -91,6 +139,9 @@ class RotaryEncoderReader:
         if not _HAVE_RPI:
             return
         self._running = False
+        if self._edge_mode:
+            self._remove_event_detect()
+            self._edge_mode = False
         if self._thread is not None:
             self._thread.join(timeout=1.0)
             self._thread = None
@@ -102,47 +153,113 @@ class RotaryEncoderReader:
         except Exception:
             pass
 
-    def _poll_loop(self):
+    def _remove_event_detect(self):
+        pins = [self.pin_a, self.pin_b]
+        if self.button_pin is not None:
+            pins.append(self.button_pin)
+        for pin in pins:
+            try:
+                GPIO.remove_event_detect(pin)
+            except Exception:
+                pass
+
+    def _read_state(self) -> int:
+        a = GPIO.input(self.pin_a)
+        b = GPIO.input(self.pin_b)
+        return ((1 if a else 0) << 1) | (1 if b else 0)
+
+    def _on_edge(self, channel):
+        try:
+            self._handle_state(self._read_state())
+        except Exception:
+            log.exception('Error handling rotary edge')
+
+    def _on_button(self, channel):
+        try:
+            self._handle_button(GPIO.input(self.button_pin))
+        except Exception:
+            log.exception('Error handling rotary button edge')
+
+    def _handle_state(self, state: int):
         # Quadrature decoding: convert transitions into +1/-1 steps
+        detents = 0
+        with self._lock:
+            if state == self._last_state:
+                return
+            now = time.monotonic_ns()
+            since = now - self._last_edge_ns
+            if since < self._min_period_ns:
+                # keep _last_state: the bounce settles back onto it
+                return
+            delta = self._TRANSITIONS[(self._last_state << 2) | state]
+            if delta != 0 and delta == -self._last_dir and since < self._reverse_guard_ns:
+                return
+            self._last_state = state
+            if delta != 0:
+                self._last_edge_ns = now
+                self._last_dir = delta
+                if self.reverse:
+                    delta = -delta
+                self._accumulator += delta
+                # when we've seen a full detent (N transitions), emit callback
+                if abs(self._accumulator) >= self.steps_per_detent:
+                    detents = int(self._accumulator / self.steps_per_detent)
+                    self._accumulator -= detents * self.steps_per_detent
+        if detents:
+            try:
+                self.callback(detents)
+            except Exception:
+                log.exception('Rotary callback raised')
+
+    def _handle_button(self, btn):
+        # btn == 0 when pressed (assuming pull-up)
+        if btn != self._last_button_state:
+            now = time.monotonic_ns()
+            # detect press transition (1 -> 0)
+            if self._last_button_state == 1 and btn == 0:
+                # debounce: ensure some time passed since last press
+                if now - self._last_button_time_ns > self._button_debounce_ns:
+                    self._last_button_time_ns = now
+                    try:
+                        if self.button_callback:
+                            self.button_callback()
+                    except Exception:
+                        log.exception('Rotary button callback raised')
+            self._last_button_state = btn
+
+    def _open_gpiomem(self) -> Optional[mmap.mmap]:
+        """Map the GPIO registers so a poll reads every pin level in one load."""
+        pins = [self.pin_a, self.pin_b]
+        if self.button_pin is not None:
+            pins.append(self.button_pin)
+        if max(pins) > 31:
+            return None
+        try:
+            with open('/dev/gpiomem', 'r+b') as f:
+                return mmap.mmap(f.fileno(), 4096)
+        except Exception:
+            log.debug('/dev/gpiomem unavailable; polling rotary pins through RPi.GPIO')
+            return None
+
+    def _poll_loop(self):
+        # a poll delayed by other work can miss quadrature states
+        _raise_thread_priority()
+        regs = self._open_gpiomem()
         while self._running:
             try:
-                a = GPIO.input(self.pin_a)
-                b = GPIO.input(self.pin_b)
-                state = ((1 if a else 0) << 1) | (1 if b else 0)
-                if state != self._last_state:
-                    delta = self._decode_transition(self._last_state, state)
-                    self._last_state = state
-                    if delta != 0:
-                        if self.reverse:
-                            delta = -delta
-                        self._accumulator += delta
-                        # when we've seen a full detent (N transitions), emit callback
-                        if abs(self._accumulator) >= self.steps_per_detent:
-                            detents = int(self._accumulator / self.steps_per_detent)
-                            self._accumulator -= detents * self.steps_per_detent
-                            try:
-                                self.callback(detents)
-                            except Exception:
-                                log.exception('Rotary callback raised')
+                if regs is not None:
+                    lev = _U32.unpack_from(regs, _GPLEV0)[0]
+                    self._handle_state((((lev >> self.pin_a) & 1) << 1) | ((lev >> self.pin_b) & 1))
+                else:
+                    self._handle_state(self._read_state())
 
                 # poll button if present (active-low)
                 if self.button_pin is not None:
                     try:
-                        btn = GPIO.input(self.button_pin)
-                        # btn == 0 when pressed (assuming pull-up)
-                        if btn != self._last_button_state:
-                            now = time.time()
-                            # detect press transition (1 -> 0)
-                            if self._last_button_state == 1 and btn == 0:
-                                # debounce: ensure some time passed since last press
-                                if now - self._last_button_time > self.button_debounce:
-                                    self._last_button_time = now
-                                    try:
-                                        if self.button_callback:
-                                            self.button_callback()
-                                    except Exception:
-                                        log.exception('Rotary button callback raised')
-                            self._last_button_state = btn
+                        if regs is not None:
+                            self._handle_button((lev >> self.button_pin) & 1)
+                        else:
+                            self._handle_button(GPIO.input(self.button_pin))
                     except Exception:
                         log.exception('Error polling rotary button')
 
@@ -150,32 +267,23 @@ class RotaryEncoderReader:
             except Exception:
                 log.exception('Error in rotary poll loop')
                 time.sleep(0.2)
+        if regs is not None:
+            regs.close()
+
+    # Gray-code transition table indexed by (prev << 2) | new:
+    # 00->01->11->10->00 is +1, the reverse is -1, anything else (no change
+    # or a skipped state from bounce) is 0.
+    _TRANSITIONS = (
+        0, 1, -1, 0,
+        -1, 0, 0, 1,
+        1, 0, 0, -1,
+        0, -1, 1, 0,
+    )
 
     @staticmethod
     def _decode_transition(prev: int, new: int) -> int:
         """Return +1 for clockwise-ish, -1 for counter-ish, 0 for invalid/bounce."""
-        # Using common Gray-code transitions
-        if prev == 0b00:
-            if new == 0b01:
-                return 1
-            if new == 0b10:
-                return -1
-        elif prev == 0b01:
-            if new == 0b11:
-                return 1
-            if new == 0b00:
-                return -1
-        elif prev == 0b11:
-            if new == 0b10:
-                return 1
-            if new == 0b01:
-                return -1
-        elif prev == 0b10:
-            if new == 0b00:
-                return 1
-            if new == 0b11:
-                return -1
-        return 0
+        return RotaryEncoderReader._TRANSITIONS[(prev << 2) | new]
 
 
 class DummyRotary:
@@ -0,0 +1,87 @@
+"""
+WS2812 strip driven from the SPI peripheral instead of PWM.
+
+Each WS2812 data bit is sent as three SPI bits at 2.4 MHz (0 -> 100,
+1 -> 110), so a byte of colour data becomes three SPI bytes. A 256-entry
+table holds the encoding for every byte value and a whole frame goes out in
+one SPI transfer, with no per-LED calls.
+
+Requires the optional `spidev` package and the strip data line on the SPI
+MOSI pin (GPIO10). The class mirrors the parts of rpi_ws281x's PixelStrip
+that LEDMatrix uses (begin/setPixelColor/show/setBrightness).
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+try:
+    import spidev
+    _HAVE_SPIDEV = True
+except Exception:
+    spidev = None
+    _HAVE_SPIDEV = False
+
+SPI_HZ = 2400000
+# line held low after a frame to latch it (>= 280us on newer WS2812B parts)
+_RESET = bytes(90)
+
+
+def _encode_byte(b: int) -> bytes:
+    bits = 0
+    for i in range(7, -1, -1):
+        bits = (bits << 3) | (0b110 if (b >> i) & 1 else 0b100)
+    return bits.to_bytes(3, 'big')
+
+
+_BIT_LUT: Tuple[bytes, ...] = tuple(_encode_byte(b) for b in range(256))
+
+
+class SpiStrip:
+    """WS2812 strip (GRB byte order) on an SPI bus."""
+
+    def __init__(self, num: int, bus: int = 0, device: int = 0, brightness: int = 255):
+        if not _HAVE_SPIDEV:
+            raise RuntimeError('spidev is not installed')
+        self._num = int(num)
+        self._bus = int(bus)
+        self._device = int(device)
+        self._spi = None
+        # GRB bytes in physical LED order
+        self._grb = bytearray(3 * self._num)
+        self.setBrightness(brightness)
+
+    def begin(self):
+        spi = spidev.SpiDev()
+        spi.open(self._bus, self._device)
+        spi.max_speed_hz = SPI_HZ
+        spi.mode = 0
+        self._spi = spi
+
+    def numPixels(self) -> int:
+        return self._num
+
+    def setPixelColor(self, n: int, color: int):
+        # color is packed 0x00RRGGBB, the same value rpi_ws281x's Color() builds
+        self._grb[3 * n:3 * n + 3] = bytes(((color >> 8) & 0xFF, (color >> 16) & 0xFF, color & 0xFF))
+
+    def set_grb(self, data):
+        """Replace the whole frame with GRB bytes in physical LED order."""
+        self._grb[:] = data
+
+    def setBrightness(self, brightness: int):
+        b = max(0, min(255, int(brightness)))
+        self._brightness = b
+        # per-byte scale table, applied to the frame with bytes.translate()
+        self._scale = bytes((v * b) // 255 for v in range(256))
+
+    def getBrightness(self) -> int:
+        return self._brightness
+
+    def show(self):
+        data = self._grb.translate(self._scale)
+        self._spi.writebytes2(b''.join(map(_BIT_LUT.__getitem__, data)) + _RESET)
+
+    def close(self):
+        if self._spi is not None:
+            self._spi.close()
+            self._spi = None
@@ -2,15 +2,83 @@
 MQTT Client for JellyJam
 Handles MQTT communication including Home Assistant MQTT Discovery
 """
+import functools
 import json
+import logging
 import threading
 import time
 from utils.logging_config import get_logger
 
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except Exception:
+    orjson = None
+    _HAVE_ORJSON = False
+
+try:
+    import ujson
+    _HAVE_UJSON = True
+except Exception:
+    ujson = None
+    _HAVE_UJSON = False
+
+try:
+    import msgpack
+    _HAVE_MSGPACK = True
+except Exception:
+    msgpack = None
+    _HAVE_MSGPACK = False
+
 log = get_logger(__name__)
 
+if _HAVE_ORJSON:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+elif _HAVE_UJSON:
+    def _dumps(obj):
+        return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+    _loads = ujson.loads
+else:
+    def _dumps(obj):
+        # compact UTF-8 output, the same bytes orjson produces
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    # json.loads accepts UTF-8 bytes directly
+    _loads = json.loads
+
+
+def _msgpack_loads(payload):
+    return msgpack.unpackb(payload, raw=False)
+
+# fixed-shape state payloads (Home Assistant JSON schema), filled with %
+_LIGHT_STATE_FMT = b'{"state":"%s","brightness":%d,"color_mode":"rgb","color":{"r":%d,"g":%d,"b":%d}}'
+_DISPLAY_STATE_ON_FMT = b'{"state":"ON","brightness":%d}'
+_DISPLAY_STATE_OFF_FMT = b'{"state":"OFF","brightness":%d}'
+
+# plain on/off light commands, applied without parsing the JSON
+_STATE_ONLY_COMMANDS = {
+    b'{"state":"ON"}': {'on': True},
+    b'{"state":"OFF"}': {'on': False},
+    b'{"state": "ON"}': {'on': True},
+    b'{"state": "OFF"}': {'on': False},
+}
+
+# nightlight state changes within this window go out as one publish
+_PUBLISH_COALESCE_SEC = 0.05
+
+
+@functools.lru_cache(maxsize=128)
+def _hex_to_rgb(hex_color):
+    """Convert hex color to RGB tuple."""
+    r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
+    return r, g, b
+
 
 class MQTTClient:
+    # availability payloads, pre-encoded
+    _ONLINE = b'online'
+    _OFFLINE = b'offline'
+    
     def __init__(self, config, nightlight=None, display=None, socketio=None):
         """
         Initialize MQTT client.
@@ -28,11 +96,22 @@ class MQTTClient:
         self.client = None
         self.connected = False
         self._stop_event = threading.Event()
+        # last nightlight state payload sent; repeats are not republished
+        self._last_published = None
+        # nightlight callbacks only set this; the publisher thread does the
+        # network work so state changes never wait on paho
+        self._publish_event = threading.Event()
+        self._publisher_thread = None
+        # serialized light state, reused while (on, color, brightness) is unchanged
+        self._last_state_key = None
+        self._last_state_payload = None
         
         # MQTT topics for nightlight
         self.base_topic = config.get('topic', 'jellyjam')
         self.light_state_topic = f"{self.base_topic}/light/state"
         self.light_command_topic = f"{self.base_topic}/light/set"
+        # same commands as light_command_topic, MessagePack-encoded (needs msgpack)
+        self.light_msgpack_command_topic = f"{self.base_topic}/light/set_msgpack"
         
         # MQTT topics for display
         self.display_state_topic = f"{self.base_topic}/display/state"
@@ -40,13 +119,27 @@ class MQTTClient:
         
         self.availability_topic = f"{self.base_topic}/status"
         
+        # command topic -> handler, used by _on_message
+        self._topic_dispatch = {
+            self.light_command_topic: self._handle_light_command,
+            self.display_command_topic: self._handle_display_command,
+        }
+        if _HAVE_MSGPACK:
+            self._topic_dispatch[self.light_msgpack_command_topic] = functools.partial(
+                self._handle_light_command, loads=_msgpack_loads)
+        
         # Home Assistant Discovery
         self.discovery_enabled = config.get('discovery', True)
         self.discovery_prefix = 'homeassistant'
         self.nightlight_device_id = 'jellyjam_nightlight'
         self.display_device_id = 'jellyjam_display'
+        self._discovery_messages = self._build_discovery()
         
         self._init_client()
+        
+        if self.nightlight:
+            self._publisher_thread = threading.Thread(target=self._publisher_loop, daemon=True)
+            self._publisher_thread.start()
     
     def _init_client(self):
         """Initialize the MQTT client."""
@@ -54,6 +147,9 @@ class MQTTClient:
             import paho.mqtt.client as mqtt
             
             self.client = mqtt.Client(client_id='jellyjam')
+            # QoS 1 publishes beyond the in-flight window wait for PUBACKs
+            # (paho default 20); the outgoing queue is already unbounded
+            self.client.max_inflight_messages_set(200)
             
             # Set callbacks
             self.client.on_connect = self._on_connect
@@ -70,7 +166,7 @@ class MQTTClient:
             # Set last will (for availability)
             self.client.will_set(
                 self.availability_topic,
-                payload='offline',
+                payload=self._OFFLINE,
                 qos=1,
                 retain=True
             )
@@ -80,7 +176,10 @@ class MQTTClient:
             port = self.config.get('port', 1883)
             
             log.info('Connecting to MQTT broker at %s:%d...', broker, port)
-            self.client.connect(broker, port, keepalive=60)
+            # connect from the network thread so an unreachable broker does
+            # not stall startup; paho keeps retrying with backoff
+            self.client.reconnect_delay_set(min_delay=1, max_delay=60)
+            self.client.connect_async(broker, port, keepalive=60)
             
             # Start network loop in background thread
             self.client.loop_start()
@@ -96,23 +195,30 @@ class MQTTClient:
         if rc == 0:
             log.info('Connected to MQTT broker')
             self.connected = True
+            self._last_published = None
             
             # Publish availability
             self.client.publish(
                 self.availability_topic,
-                payload='online',
+                payload=self._ONLINE,
                 qos=1,
                 retain=True
             )
             
-            # Subscribe to command topics
+            # Subscribe to command topics in one SUBSCRIBE packet
+            subscriptions = []
             if self.nightlight:
-                self.client.subscribe(self.light_command_topic)
-                log.info('Subscribed to %s', self.light_command_topic)
+                subscriptions.append((self.light_command_topic, 0))
+                if _HAVE_MSGPACK:
+                    subscriptions.append((self.light_msgpack_command_topic, 0))
             
             if self.display:
-                self.client.subscribe(self.display_command_topic)
-                log.info('Subscribed to %s', self.display_command_topic)
+                subscriptions.append((self.display_command_topic, 0))
+            
+            if subscriptions:
+                self.client.subscribe(subscriptions)
+                for topic, _qos in subscriptions:
+                    log.info('Subscribed to %s', topic)
             
             # Send Home Assistant discovery message
             if self.discovery_enabled:
@@ -133,59 +239,69 @@ class MQTTClient:
     def _on_message(self, client, userdata, msg):
         """Callback when a message is received."""
         try:
-            if msg.topic == self.light_command_topic:
-                self._handle_light_command(msg.payload.decode('utf-8'))
-            elif msg.topic == self.display_command_topic:
-                self._handle_display_command(msg.payload.decode('utf-8'))
+            handler = self._topic_dispatch.get(msg.topic)
+            if handler is not None:
+                handler(msg.payload)
         except Exception as e:
             log.error('Error handling MQTT message: %s', e)
     
-    def _handle_light_command(self, payload):
+    def _handle_light_command(self, payload, loads=_loads):
         """Handle incoming light control commands from MQTT."""
         try:
-            data = json.loads(payload)
+            changes = _STATE_ONLY_COMMANDS.get(payload) if loads is _loads else None
+            if changes is None:
+                changes = self._light_command_changes(loads(payload))
             
             if not self.nightlight:
                 return
             
-            # Handle state (ON/OFF)
-            if 'state' in data:
-                on = data['state'].upper() == 'ON'
-                self.nightlight.set_state(on=on)
-            
-            # Handle brightness (0-255)
-            if 'brightness' in data:
-                brightness = int(data['brightness'])
-                self.nightlight.set_state(brightness=brightness)
-            
-            # Handle color
-            if 'color' in data:
-                color_data = data['color']
-                if 'r' in color_data and 'g' in color_data and 'b' in color_data:
-                    # Convert RGB to hex
-                    r = int(color_data['r'])
-                    g = int(color_data['g'])
-                    b = int(color_data['b'])
-                    hex_color = f'#{r:02x}{g:02x}{b:02x}'
-                    self.nightlight.set_state(color=hex_color)
-            
-            # Publish updated state
-            self._publish_state()
+            # the nightlight state callback publishes the updated state
+            state = self.nightlight.set_state(**changes)
             
             # Emit Socket.IO update for web UI
-            if self.socketio and self.nightlight:
-                state = self.nightlight.get_state()
+            if self.socketio:
                 log.debug('Emitting nightlight_update via Socket.IO: %s', state)
                 self.socketio.emit('nightlight_update', state)
             
         except Exception as e:
             log.error('Error handling light command: %s', e)
     
+    def _light_command_changes(self, data):
+        """Map a decoded light command to set_state() keyword arguments."""
+        # collect every field so the command is applied as one state change
+        changes = {}
+        
+        # Handle state (ON/OFF)
+        state = data.get('state')
+        if state is not None:
+            changes['on'] = state.upper() == 'ON'
+        
+        # Handle brightness (0-255)
+        brightness = data.get('brightness')
+        if brightness is not None:
+            changes['brightness'] = int(brightness)
+        
+        # Handle color
+        color_data = data.get('color')
+        if color_data is not None:
+            try:
+                # Convert RGB to hex; out-of-range channels are ignored
+                rgb = bytes((int(color_data['r']), int(color_data['g']), int(color_data['b'])))
+            except (KeyError, TypeError, ValueError):
+                rgb = None
+            if rgb is not None:
+                changes['color'] = '#' + rgb.hex()
+        
+        return changes
+    
     def _handle_display_command(self, payload):
         """Handle incoming display control commands from MQTT."""
         try:
-            data = json.loads(payload)
-            log.debug('Received display MQTT command: %s', data)
+            data = _loads(payload)
+            # one level check instead of a debug() call per step
+            debug = log.isEnabledFor(logging.DEBUG)
+            if debug:
+                log.debug('Received display MQTT command: %s', data)
             
             if not self.display:
                 log.warning('Cannot handle display command: display is None')
@@ -194,17 +310,20 @@ class MQTTClient:
             # Handle state (ON/OFF)
             if 'state' in data:
                 on = data['state'].upper() == 'ON'
-                log.debug('Setting display power to: %s', on)
+                if debug:
+                    log.debug('Setting display power to: %s', on)
                 self.display.set_power(on)
             
             # Handle brightness (0-100 scale, matches display internal range)
             if 'brightness' in data:
                 brightness = int(data['brightness'])
-                log.debug('Setting display brightness to: %d', brightness)
+                if debug:
+                    log.debug('Setting display brightness to: %d', brightness)
                 self.display.set_brightness(brightness)
             
             # Publish updated state
-            log.debug('Publishing updated display state back to MQTT...')
+            if debug:
+                log.debug('Publishing updated display state back to MQTT...')
             self.publish_display_state()
             
             # Emit Socket.IO update for web UI
@@ -213,80 +332,78 @@ class MQTTClient:
                     'on': self.display.get_power(),
                     'brightness': self.display.get_brightness()
                 }
-                log.debug('Emitting display_power_update via Socket.IO: %s', display_state)
+                if debug:
+                    log.debug('Emitting display_power_update via Socket.IO: %s', display_state)
                 self.socketio.emit('display_power_update', display_state)
-            else:
+            elif debug:
                 if not self.socketio:
                     log.debug('Cannot emit Socket.IO update: socketio is None')
             
         except Exception as e:
-            log.error('Error handling display command: %s', e, exc_info=True)
+            log.error('Error handling display command: %s', e)
+            log.debug('Error handling display command traceback', exc_info=True)
+    
+    def _build_discovery(self):
+        """Serialize the Home Assistant discovery messages; they never change."""
+        device = {
+            "identifiers": ["jellyjam"],
+            "name": "JellyJam NFC Player",
+            "model": "NFC Music Player with Nightlight",
+            "manufacturer": "JellyJam"
+        }
+        messages = []
+        
+        # Nightlight discovery
+        if self.nightlight:
+            nightlight_topic = f"{self.discovery_prefix}/light/{self.nightlight_device_id}/config"
+            
+            nightlight_payload = {
+                "name": "JellyJam Nightlight",
+                "unique_id": self.nightlight_device_id,
+                "state_topic": self.light_state_topic,
+                "command_topic": self.light_command_topic,
+                "availability_topic": self.availability_topic,
+                "schema": "json",
+                "brightness": True,
+                "brightness_scale": 255,
+                "color_mode": True,
+                "supported_color_modes": ["rgb"],
+                "device": device
+            }
+            messages.append(('nightlight', nightlight_topic, _dumps(nightlight_payload)))
+        
+        # Display discovery
+        if self.display:
+            display_topic = f"{self.discovery_prefix}/light/{self.display_device_id}/config"
+            
+            display_payload = {
+                "name": "JellyJam Display",
+                "unique_id": self.display_device_id,
+                "state_topic": self.display_state_topic,
+                "command_topic": self.display_command_topic,
+                "availability_topic": self.availability_topic,
+                "schema": "json",
+                "brightness": True,
+                "brightness_scale": 100,
+                "icon": "mdi:television",
+                "device": device
+            }
+            messages.append(('display', display_topic, _dumps(display_payload)))
+        
+        return messages
     
     def _send_discovery(self):
         """Send Home Assistant MQTT Discovery messages."""
         try:
-            # Nightlight discovery
-            if self.nightlight:
-                nightlight_topic = f"{self.discovery_prefix}/light/{self.nightlight_device_id}/config"
-                
-                nightlight_payload = {
-                    "name": "JellyJam Nightlight",
-                    "unique_id": self.nightlight_device_id,
-                    "state_topic": self.light_state_topic,
-                    "command_topic": self.light_command_topic,
-                    "availability_topic": self.availability_topic,
-                    "schema": "json",
-                    "brightness": True,
-                    "brightness_scale": 255,
-                    "color_mode": True,
-                    "supported_color_modes": ["rgb"],
-                    "device": {
-                        "identifiers": ["jellyjam"],
-                        "name": "JellyJam NFC Player",
-                        "model": "NFC Music Player with Nightlight",
-                        "manufacturer": "JellyJam"
-                    }
-                }
-                
-                self.client.publish(
-                    nightlight_topic,
-                    payload=json.dumps(nightlight_payload),
-                    qos=1,
-                    retain=True
-                )
-                
-                log.info('Sent Home Assistant discovery for nightlight to %s', nightlight_topic)
-            
-            # Display discovery
-            if self.display:
-                display_topic = f"{self.discovery_prefix}/light/{self.display_device_id}/config"
-                
-                display_payload = {
-                    "name": "JellyJam Display",
-                    "unique_id": self.display_device_id,
-                    "state_topic": self.display_state_topic,
-                    "command_topic": self.display_command_topic,
-                    "availability_topic": self.availability_topic,
-                    "schema": "json",
-                    "brightness": True,
-                    "brightness_scale": 100,
-                    "icon": "mdi:television",
-                    "device": {
-                        "identifiers": ["jellyjam"],
-                        "name": "JellyJam NFC Player",
-                        "model": "NFC Music Player with Nightlight",
-                        "manufacturer": "JellyJam"
-                    }
-                }
-                
+            for name, topic, payload in self._discovery_messages:
                 self.client.publish(
-                    display_topic,
-                    payload=json.dumps(display_payload),
+                    topic,
+                    payload=payload,
                     qos=1,
                     retain=True
                 )
                 
-                log.info('Sent Home Assistant discovery for display to %s', display_topic)
+                log.info('Sent Home Assistant discovery for %s to %s', name, topic)
             
         except Exception as e:
             log.error('Error sending Home Assistant discovery: %s', e)
@@ -298,27 +415,27 @@ class MQTTClient:
                 return
             
             state = self.nightlight.get_state()
+            key = (state['on'], state['color'], state['brightness'])
+            if key != self._last_state_key:
+                # Convert to Home Assistant format
+                r, g, b = _hex_to_rgb(state['color'])
+                
+                self._last_state_payload = _LIGHT_STATE_FMT % (
+                    b'ON' if state['on'] else b'OFF', int(state['brightness']), r, g, b)
+                self._last_state_key = key
             
-            # Convert to Home Assistant format
-            r, g, b = self._hex_to_rgb(state['color'])
-            
-            payload = {
-                "state": "ON" if state['on'] else "OFF",
-                "brightness": state['brightness'],
-                "color_mode": "rgb",
-                "color": {
-                    "r": r,
-                    "g": g,
-                    "b": b
-                }
-            }
+            payload = self._last_state_payload
+            if payload == self._last_published:
+                return
             
+            # transient state: fire-and-forget, no PUBACK round-trip per change
             self.client.publish(
                 self.light_state_topic,
-                payload=json.dumps(payload),
-                qos=1,
+                payload=payload,
+                qos=0,
                 retain=True
             )
+            self._last_published = payload
             
         except Exception as e:
             log.error('Error publishing state: %s', e)
@@ -337,45 +454,52 @@ class MQTTClient:
             power_on = self.display.get_power()
             brightness_100 = self.display.get_brightness()  # Already in 0-100 range
             
-            payload = {
-                "state": "ON" if power_on else "OFF",
-                "brightness": brightness_100
-            }
+            payload = (_DISPLAY_STATE_ON_FMT if power_on else _DISPLAY_STATE_OFF_FMT) % int(brightness_100)
             
-            log.debug('Publishing display state to %s: %s', self.display_state_topic, payload)
-            log.debug('  Display object: %s', self.display)
-            log.debug('  Power: %s, Brightness: %d', power_on, brightness_100)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('Publishing display state to %s: %s', self.display_state_topic, payload)
+                log.debug('  Display object: %s', self.display)
+                log.debug('  Power: %s, Brightness: %d', power_on, brightness_100)
             
+            # transient state, retained for Home Assistant; no PUBACK needed
             self.client.publish(
                 self.display_state_topic,
-                payload=json.dumps(payload),
-                qos=1,
+                payload=payload,
+                qos=0,
                 retain=True
             )
             
         except Exception as e:
-            log.error('Error publishing display state: %s', e, exc_info=True)
-    
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+            log.error('Error publishing display state: %s', e)
+            log.debug('Error publishing display state traceback', exc_info=True)
     
     def publish_state_update(self, state):
         """
         Callback for nightlight state changes.
-        Publishes state to MQTT.
+        Publishes state to MQTT, coalescing bursts of changes.
         """
-        self._publish_state()
+        self._publish_event.set()
+    
+    def _publisher_loop(self):
+        """Publish the latest nightlight state after each burst of changes."""
+        while True:
+            self._publish_event.wait()
+            if self._stop_event.is_set():
+                return
+            self._stop_event.wait(_PUBLISH_COALESCE_SEC)
+            self._publish_event.clear()
+            self._publish_state()
     
     def disconnect(self):
         """Disconnect from MQTT broker."""
+        self._stop_event.set()
+        self._publish_event.set()
         try:
             if self.client and self.connected:
                 # Publish offline status
                 self.client.publish(
                     self.availability_topic,
-                    payload='offline',
+                    payload=self._OFFLINE,
                     qos=1,
                     retain=True
                 )
@@ -5,13 +5,31 @@ All NFC reader implementations should inherit from NFCReaderPlugin
 and implement the required methods.
 """
 
-import threading
 import logging
 from abc import ABC, abstractmethod
 
 log = logging.getLogger(__name__)
 
 
+def _is_number(value):
+    try:
+        int(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _is_boolean(value):
+    return isinstance(value, bool)
+
+
+# schema type -> (value check, error suffix)
+_TYPE_CHECKS = {
+    'number': (_is_number, 'must be a number'),
+    'boolean': (_is_boolean, 'must be true/false'),
+}
+
+
 class NFCReaderPlugin(ABC):
     """
     Abstract base class for NFC reader plugins.
@@ -19,6 +37,9 @@ class NFCReaderPlugin(ABC):
     Plugins must implement start(), stop(), and optionally simulate_scan().
     """
     
+    # subclasses that add instance state without their own __slots__ get a __dict__
+    __slots__ = ('callback', 'config', '_running', '_thread')
+    
     def __init__(self, callback=None, config=None):
         """
         Initialize the NFC reader plugin.
@@ -101,6 +122,24 @@ class NFCReaderPlugin(ABC):
         """Return human-readable plugin name."""
         return cls.__name__
     
+    @classmethod
+    def _validation_rules(cls):
+        """Return (field, label, required, check, message) per schema field.
+
+        Built once per plugin class from get_config_schema(), which describes
+        static options.
+        """
+        # look in the class's own __dict__ so subclasses do not reuse a parent's rules
+        rules = cls.__dict__.get('_rules_cache')
+        if rules is None:
+            rules = []
+            for field, field_schema in cls.get_config_schema().items():
+                check, message = _TYPE_CHECKS.get(field_schema.get('type'), (None, None))
+                rules.append((field, field_schema.get('label'), bool(field_schema.get('required')), check, message))
+            rules = tuple(rules)
+            cls._rules_cache = rules
+        return rules
+    
     @classmethod
     def validate_config(cls, config):
         """
@@ -113,26 +152,17 @@ class NFCReaderPlugin(ABC):
             list: List of error messages (empty if valid).
         """
         errors = []
-        schema = cls.get_config_schema()
         
-        for field, field_schema in schema.items():
+        for field, label, required, check, message in cls._validation_rules():
             value = config.get(field)
             
             # Check required fields
-            if field_schema.get('required') and value is None:
-                errors.append(f"{field_schema['label']} is required")
+            if required and value is None:
+                errors.append(f"{label} is required")
                 continue
             
             # Type validation
-            if value is not None:
-                expected_type = field_schema.get('type')
-                if expected_type == 'number':
-                    try:
-                        int(value)
-                    except (ValueError, TypeError):
-                        errors.append(f"{field_schema['label']} must be a number")
-                elif expected_type == 'boolean':
-                    if not isinstance(value, bool):
-                        errors.append(f"{field_schema['label']} must be true/false")
+            if value is not None and check is not None and not check(value):
+                errors.append(f"{label} {message}")
         
         return errors
@@ -5,8 +5,6 @@ This plugin doesn't connect to real hardware - it only responds
 to simulated scans triggered via the web UI or API.
 """
 
-import threading
-import time
 import logging
 from .base import NFCReaderPlugin
 
@@ -20,6 +18,8 @@ class MockNFCPlugin(NFCReaderPlugin):
     Useful for development and testing without hardware.
     """
     
+    __slots__ = ()
+    
     def start(self):
         """Start the mock reader (just sets running flag)."""
         self._running = True
@@ -156,7 +156,7 @@ class PN532Plugin(NFCReaderPlugin):
                 
                 if uid:
                     # Convert UID to hex string
-                    card_id = ''.join(['%02X' % b for b in uid])
+                    card_id = bytes(uid).hex().upper()
                     current_time = time.time()
                     
                     # Debounce: ignore same card if scanned too recently
@@ -13,6 +13,7 @@ import logging
 import logging.handlers
 import sys
 import os
+import time
 from collections import deque
 import threading
 
@@ -103,6 +104,10 @@ class CircularBufferHandler(logging.Handler):
 _buffer_handler = None
 _file_handler = None
 
+# Last emit time and suppressed count per key for log_exception_throttled
+_throttle_state = {}
+_throttle_lock = threading.Lock()
+
 
 def setup_logging(level=logging.INFO, buffer_capacity=1000, 
                   enable_file_logging=False, log_file_dir=None, 
@@ -197,6 +202,34 @@ def get_logger(name):
     return logging.getLogger(name)
 
 
+def log_exception_throttled(logger, key, msg, *args, interval=60.0):
+    """
+    Log an exception with traceback at most once per interval for a given key.
+    
+    Intended for error paths that can fire on every frame (e.g. disconnected
+    hardware) where one traceback per call would flood the logs. Repeats
+    within the interval are counted and reported with the next emitted record.
+    
+    Args:
+        logger: Logger to emit the record on
+        key: Identifier grouping repeated failures together
+        msg: Log message format string
+        *args: Arguments for the format string
+        interval: Minimum seconds between emitted records for this key (default: 60)
+    """
+    now = time.monotonic()
+    with _throttle_lock:
+        last, suppressed = _throttle_state.get(key, (None, 0))
+        if last is not None and now - last < interval:
+            _throttle_state[key] = (last, suppressed + 1)
+            return
+        _throttle_state[key] = (now, 0)
+    if suppressed:
+        msg = msg + ' (%d similar errors suppressed)'
+        args = args + (suppressed,)
+    logger.exception(msg, *args)
+
+
 def get_log_buffer():
     """
     Get the global log buffer handler.